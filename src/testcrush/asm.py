@@ -12,8 +12,10 @@ from dataclasses import dataclass
 
 log = get_logger()
 
+_WHITESPACE_RE = re.compile(r"\s+")
 
-@dataclass
+
+@dataclass(slots=True)
 class Codeline:
     """Represents a line of assembly code"""
 
@@ -93,7 +95,9 @@ class Codeline:
 
     def __eq__(self, other: 'Codeline|int') -> bool:
 
-        if isinstance(other, int):
+        if self is other:
+            return True
+        elif isinstance(other, int):
             return self.lineno == other
         elif isinstance(other, Codeline):
             return self.lineno == other.lineno
@@ -106,7 +110,7 @@ class ISA(metaclass=Singleton):
 
     def __init__(self, isa: pathlib.Path) -> "ISA":
 
-        self.mnemonics: set = set()
+        self.mnemonics: frozenset = frozenset()
         self.source: pathlib.Path = isa.resolve()
 
         try:
@@ -119,6 +123,7 @@ class ISA(metaclass=Singleton):
             log.fatal(f"ISA File {self.source} not found! Exiting...")
             exit(1)
 
+        mnemonics = set()
         for lineno, line in enumerate(lines, start=1):
 
             if not line:
@@ -133,20 +138,23 @@ class ISA(metaclass=Singleton):
             if line[0] == '#':
                 continue
 
-            self.mnemonics.add(line.strip())
+            mnemonics.add(line.strip())
+
+        # The ISA is shared by every AssemblyHandler, hence read-only.
+        self.mnemonics = frozenset(mnemonics)
 
     def __repr__(self):
         return f"ISA({str(self.source)})"
 
-    def get_mnemonics(self) -> set:
+    def get_mnemonics(self) -> frozenset:
         """
-        Returns a set with the ISA-lang mnemonics.
+        Returns a frozenset with the ISA-lang mnemonics.
 
         Args:
             None
 
         Returns:
-            set: A set with all the ISA-lang mnemonics."""
+            frozenset: A frozenset with all the ISA-lang mnemonics."""
 
         return self.mnemonics
 
@@ -187,21 +195,26 @@ class AssemblyHandler():
 
                 log.debug(f"Reading from file {assembly_source}")
 
-                # 0-based indexing for lineno!
-                for lineno, line in enumerate(asm_file, start=0):
+                # Read in one go. Split on newlines only so that
+                # the line numbers match the line iteration that
+                # remove() and restore() perform on the file.
+                lines = asm_file.read().split('\n')
 
-                    # We are currently not interested in the contents
-                    # of each line of code. We just want to   extract
-                    # the codeline as-is and remove any \s whitespace
-                    line = re.sub(r'\s+', ' ', line.strip())
+            # 0-based indexing for lineno!
+            for lineno, line in enumerate(lines, start=0):
 
-                    if not line:
-                        continue
+                # We are currently not interested in the contents
+                # of each line of code. We just want to   extract
+                # the codeline as-is and remove any \s whitespace
+                line = _WHITESPACE_RE.sub(' ', line.strip())
+
+                if not line:
+                    continue
 
-                    code.append(Codeline(
-                        lineno=lineno,
-                        data=fr"{line}",
-                        valid_insn=isa.is_instruction(line)))
+                code.append(Codeline(
+                    lineno=lineno,
+                    data=fr"{line}",
+                    valid_insn=isa.is_instruction(line)))
 
         except FileNotFoundError:
 
@@ -320,14 +333,17 @@ class AssemblyHandler():
             shutil.move(new_file, self.asm_file)
 
         # Update the lineno attribute of every codeline
-        # that is below the just removed codeline.
+        # that is below the just removed codeline. The
+        # attribute is accessed directly as this   runs
+        # for every candidate on each removal.
+        removed_lineno = codeline.lineno
         for chunk in self.candidates:
 
             for chunk_codeline in chunk:
 
-                if chunk_codeline > codeline.lineno:
+                if chunk_codeline.lineno > removed_lineno:
 
-                    chunk_codeline -= 1
+                    chunk_codeline.lineno -= 1
 
         # Updating changelog to keep track of the edits to the asm file
         self.asm_file_changelog.append(codeline)
@@ -354,6 +370,7 @@ class AssemblyHandler():
         # to be restored must get a +1 to their lineno at-
         # ribute in order to be aligned with the  original
         # assembly source file line numbers.
+        restored_lineno = codeline_to_be_restored.lineno
         for chunk in self.candidates:
 
             for chunk_codeline in chunk:
@@ -366,9 +383,9 @@ class AssemblyHandler():
 
                     continue
 
-                if chunk_codeline >= codeline_to_be_restored:
+                if chunk_codeline.lineno >= restored_lineno:
 
-                    chunk_codeline += 1
+                    chunk_codeline.lineno += 1
 
         with open(self.asm_file) as source, tempfile.NamedTemporaryFile('w', delete=False) as new_source:
 
@@ -95,6 +95,20 @@ def sanitize_a0_configuration(config_file: pathlib.Path) -> None:
     except toml.TomlDecodeError as e:
         print(f"Error decoding TOML: {e}")
 
+    _check_a0_keys(config, config_file)
+
+
+def _check_a0_keys(config: dict[str, Any], config_file: pathlib.Path) -> None:
+    """Checks whether all key-value pairs are present in an already loaded TOML configuration.
+
+    Args:
+        config (dict): The loaded TOML configuration.
+        config_file (pathlib.Path): The TOML configuration file it was loaded from.
+
+    Raises:
+        KeyError: if a key is missing from the TOML configuration.
+    """
+
     for toml_path in A0_KEYS.values():
 
         section = toml_path[0]
@@ -133,9 +147,9 @@ def parse_a0_configuration(config_file: pathlib.Path) -> tuple[str, list, dict]:
 
         return d if d else default
 
-    sanitize_a0_configuration(config_file)
-
+    # Loaded once and sanitized in place. TOML decoding dominates the cost.
     config = toml.load(config_file)
+    _check_a0_keys(config, config_file)
 
     try:
         user_defines = config["user_defines"]
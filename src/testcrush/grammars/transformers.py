@@ -3,6 +3,7 @@
 
 import lark
 import pathlib
+import sys
 
 from typing import Literal, Any, Iterable
 from testcrush.zoix import Fault
@@ -30,6 +31,14 @@ class FaultReportFaultListTransformer(lark.Transformer):
     _prev_prime: Fault = None
     _is_prime: bool = False
 
+    def __init__(self, visit_tokens: bool = True) -> 'FaultReportFaultListTransformer':
+
+        super().__init__(visit_tokens)
+
+        # Attribute values repeat across faults (e.g., the same PC), hence
+        # a single string object is kept for each distinct value.
+        self._strings: dict[str, str] = dict()
+
     @staticmethod
     def filter_out_discards(container: Iterable) -> filter:
 
@@ -42,8 +51,31 @@ class FaultReportFaultListTransformer(lark.Transformer):
 
         faults = list(self.filter_out_discards(faults))
 
+        # Release the interned attribute values of this fault list
+        self._strings.clear()
+
         return faults
 
+    def header(self, args) -> lark.visitors._DiscardType:
+        """
+        A new fault list begins. Since the header is reduced before any fault, the state left by a previous parse
+        (even by a failed one) is reset here and the transformer can be reused. The header is discarded.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            FaultList SomeCNAMEfaultListName {
+            ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+                       discarded
+        """
+
+        self._prev_fstatus = ""
+        self._prev_prime = None
+        self._is_prime = False
+        self._strings.clear()
+
+        return lark.Discard
+
     def optional_name(self, fault_list_name: str) -> lark.visitors._DiscardType:
         """
         Discard the name of the fault list.
@@ -89,12 +121,12 @@ class FaultReportFaultListTransformer(lark.Transformer):
         if not self._is_prime:
 
             self._prev_prime.equivalent_faults += 1
-            fault = Fault(**dict(fault_parts))
+            fault = Fault.from_fields(fault_parts)
             fault.set("equivalent_to", self._prev_prime)
 
         else:
 
-            fault = Fault(**dict(fault_parts))
+            fault = Fault.from_fields(fault_parts)
 
             # Reset the flag
             self._is_prime = False
@@ -139,8 +171,10 @@ class FaultReportFaultListTransformer(lark.Transformer):
         # point to the current prime fault.
         # This variable is updated  when  a
         # new prime fault is encountered.
+        # The handful of distinct statuses is
+        # interned, hence all faults share it.
 
-        fault_status = str(fault_status)
+        fault_status = sys.intern(str(fault_status))
 
         if fault_status == "--":
             fault_status = self._prev_fstatus
@@ -163,7 +197,7 @@ class FaultReportFaultListTransformer(lark.Transformer):
                      consumed
         """
 
-        return ("fault_type", str(fault_type))
+        return ("fault_type", sys.intern(str(fault_type)))
 
     def timing_info(self, timings: list[str]) -> tuple[Literal["Timing Info"], list[str]]:
         """
@@ -238,7 +272,9 @@ class FaultReportFaultListTransformer(lark.Transformer):
                                                                         ignored      consumed
         """
 
-        return (str(attribute_name), str(attribute_value))
+        attribute_value = str(attribute_value)
+
+        return (sys.intern(str(attribute_name)), self._strings.setdefault(attribute_value, attribute_value))
 
 
 class FaultReportStatusGroupsTransformer(lark.Transformer):
@@ -13,8 +13,7 @@ log = utils.get_logger()
 
 def execute_a0(configuration: pathlib.Path):
 
-    config.sanitize_a0_configuration(configuration)
-
+    # Also sanitizes the configuration
     ISA, asm_src, a0_settings, a0_preprocessor_settings = config.parse_a0_configuration(configuration)
 
     A0 = a0.A0(pathlib.Path(ISA), asm_src, a0_settings)
@@ -2,14 +2,21 @@
 # SPDX-License-Identifier: MIT
 
 import time
+import functools
+import bisect
+import array
 import logging
 import sys
 import shutil
 import subprocess
 import pathlib
 import zipfile
+import mmap
 import os
-import psutil
+import signal
+import select
+
+from elftools.elf.elffile import ELFFile
 
 # # # # # # # # # # # # # # # # # # # # # #
 #    __                   _               #
@@ -38,11 +45,7 @@ def setup_logger(stream_logging_level: int, log_file: str | None = None) -> None
         """Indents the record's body."""
         def format(self, record):
 
-            original_message = super().format(record)
-
-            indented_message = "\n>\t".join(original_message.splitlines())
-
-            return indented_message
+            return super().format(record).replace("\n", "\n>\t")
 
     _v_to_levels = {
         0: logging.INFO,
@@ -70,8 +73,9 @@ def setup_logger(stream_logging_level: int, log_file: str | None = None) -> None
             logger.addHandler(log_file_handler)
 
 
+@functools.lru_cache(maxsize=1)
 def get_logger() -> logging.Logger:
-    """Return the pre-configured logger."""
+    """Return the pre-configured logger. The lookup is performed once and cached."""
     return logging.getLogger(__name__)
 
 
@@ -140,65 +144,74 @@ def compile_assembly(*instructions, exit_on_error: bool = False) -> bool:
 
                 return False
 
-            for line in stdout.splitlines():
-                log.debug(f"{cmd}: {line.rstrip()}")
+            # Hoisted out of the per-line loop. Lines are only formatted when logged.
+            debug = log.debug if log.isEnabledFor(logging.DEBUG) else None
+
+            if debug:
+                for line in stdout.splitlines():
+                    debug("%s: %s", cmd, line.rstrip())
 
     return True
 
 
+_ZIP_COPY_BUFFER_SIZE = 128 * 1024
+
+
 def zip_archive(archive_name: str, *files) -> str:
     """
     Generates a .zip archive of arbitrary files.
 
+    The files are streamed into the archive as-is (``ZIP_STORED``) and flattened to their basenames. If two files
+    share the same basename, the last one is archived.
+
     Args:
         archive_name (str): The filename (stem) of the zip archive.
 
     Returns:
         str: The generated archive path string.
     """
-    archive = pathlib.Path(archive_name)
-    archive.mkdir(exist_ok=True)
-
-    for file_ in files:
-        shutil.copy(file_, archive)
-
-    archive = archive.resolve()
+    archive = pathlib.Path(archive_name).resolve()
     zip_filename = f"{archive.parent}/{archive.stem}.zip"
 
+    entries = {pathlib.Path(file_).name: file_ for file_ in files}
+
     with zipfile.ZipFile(zip_filename, 'w') as zipf:
 
-        for foldername, _, filenames in os.walk(archive_name):
+        for filename, file_ in entries.items():
 
-            for filename in filenames:
+            zip_info = zipfile.ZipInfo.from_file(file_, arcname=filename)
+            zip_info.compress_type = zipfile.ZIP_STORED
 
-                file_path = f"{foldername}/{filename}"
-                zipf.write(file_path, filename)
+            with open(file_, 'rb') as src, zipf.open(zip_info, 'w') as dst:
+                shutil.copyfileobj(src, dst, length=_ZIP_COPY_BUFFER_SIZE)
 
-    shutil.rmtree(archive)
     return zip_filename
 
 
-def addr2line(elf_file: pathlib.Path, pc_address: str) -> tuple[str, int] | None:
+@functools.lru_cache(maxsize=8)
+def _elf_line_table(elf_file: str, mtime_ns: int) -> tuple[array.array, array.array, list[tuple[str, int]]] | None:
     """
-    Mimics the functionality of the addr2line binutil using pyelftools.
-    Takes an ELF file and an address, and returns the corresponding
-    file name and line number using the .debug_line section.
+    Builds the address-to-line table of an ELF file from its ``.debug_line`` section.
+
+    Every row of a DWARF line program covers the addresses from its own address up to (excluding) the address of the
+    next row of the same sequence. The rows of all CUs are returned sorted by their start address as three parallel
+    containers: the start addresses, the end addresses and the ``(file, line)`` pairs. The table is cached per file
+    and modification time, hence ``mtime_ns`` which is otherwise unused.
 
     Args:
-        elf_file (pathlib.Path): The elf file.
-        pc_address (str): The address of the program counter to look for within the elf in hexadecimal format as str.
+        elf_file (str): The elf file.
+        mtime_ns (int): The modification time of the elf file in nanoseconds.
 
     Returns:
-        tuple: A file-line pair. The file (index-0) is the source which contains the line number that corresponds to the
-        ``pc_address`` and the line (index-1) is the 1-based indexing of the line number within the source file.
+        tuple | None: The (starts, ends, rows) table or ``None`` if the file has no DWARF info.
     """
 
-    from elftools.elf.elffile import ELFFile
+    intervals = list()
 
-    address = int(pc_address, 16)
-
-    with open(elf_file, 'rb') as f:
-        elf = ELFFile(f)
+    # pyelftools issues many small seek/read pairs while walking the DWARF
+    # sections. Serve them from a read-only mapping instead of syscalls.
+    with open(elf_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as elf_map:
+        elf = ELFFile(elf_map)
 
         if not elf.has_dwarf_info():
             log.debug(f"No DWARF info found in {elf_file}")
@@ -206,35 +219,106 @@ def addr2line(elf_file: pathlib.Path, pc_address: str) -> tuple[str, int] | None
 
         dwarf_info = elf.get_dwarf_info()
 
-        # Find the .debug_line section and retrieve line program information
         for CU in dwarf_info.iter_CUs():
 
             line_program = dwarf_info.line_program_for_CU(CU)
 
-            if line_program:
+            if not line_program:
+                continue
+
+            # Decode (and intern) each file name once rather than per row
+            file_names = [sys.intern(file_entry.name.decode('utf-8')) for file_entry in line_program['file_entry']]
+            previous = None
 
-                # Iterate over all entries in the line program
-                for entry in line_program.get_entries():
+            for entry in line_program.get_entries():
 
-                    state = entry.state
+                state = entry.state
 
-                    if state and state.address == address:
+                if not state:
+                    continue
 
-                        file_name = line_program['file_entry'][state.file - 1].name
+                # Close the interval of the previous row of this sequence.
+                # Zero-length intervals are shadowed by their successor.
+                if previous and previous.address < state.address:
+                    intervals.append((previous.address, state.address,
+                                      file_names[previous.file - 1], int(previous.line)))
 
-                        return (file_name.decode('utf-8'), int(state.line))
+                previous = None if state.end_sequence else state
+
+    intervals.sort(key=lambda interval: interval[0])
+
+    starts = array.array('Q', (start for start, _, _, _ in intervals))
+    ends = array.array('Q', (end for _, end, _, _ in intervals))
+    rows = [(file_name, line) for _, _, file_name, line in intervals]
+
+    return starts, ends, rows
+
+
+def addr2line(elf_file: pathlib.Path, pc_address: str) -> tuple[str, int] | None:
+    """
+    Mimics the functionality of the addr2line binutil using pyelftools.
+    Takes an ELF file and an address, and returns the corresponding
+    file name and line number using the .debug_line section.
+
+    The line table of the ELF file is built once and then cached. Each lookup is a binary search for the row whose
+    address range contains ``pc_address``.
+
+    Args:
+        elf_file (pathlib.Path): The elf file.
+        pc_address (str): The address of the program counter to look for within the elf in hexadecimal format as str.
+
+    Returns:
+        tuple: A file-line pair. The file (index-0) is the source which contains the line number that corresponds to the
+        ``pc_address`` and the line (index-1) is the 1-based indexing of the line number within the source file.
+    """
+
+    address = int(pc_address, 16)
+
+    elf_file = pathlib.Path(elf_file).resolve()
+    line_table = _elf_line_table(str(elf_file), elf_file.stat().st_mtime_ns)
+
+    if line_table is None:
+        return None
+
+    starts, ends, rows = line_table
+
+    index = bisect.bisect_right(starts, address) - 1
+
+    if index >= 0 and address < ends[index]:
+        return rows[index]
 
     return (None, None)
 
 
+_SIGKILL_GRACE_PERIOD = 1.0
+
+
 def reap_process_tree(pid: int, timeout: float = 5.0) -> None:
     """Gracefully terminate and reap the process tree for a given PID.
 
+    On Linux, the descendants are signalled and awaited through pidfds. On any other platform the tree is walked with
+    ``psutil``.
+
     Args:
         pid (int): The process ID of the root process.
-        timeout (float): Time in seconds to wait for processes to be reaped.
+        timeout (float): Time in seconds to wait for processes to terminate gracefully before they are killed.
     """
 
+    if sys.platform == "linux" and hasattr(os, "pidfd_open"):
+        try:
+            _reap_with_pidfds(pid, timeout)
+            return
+        except NotImplementedError:  # Kernel older than 5.3
+            pass
+
+    _reap_with_psutil(pid, timeout)
+
+
+def _reap_with_psutil(pid: int, timeout: float) -> None:
+    """Portable fallback of ``reap_process_tree`` based on ``psutil``."""
+
+    import psutil
+
     parent = psutil.Process(pid)
     children = parent.children(recursive=True)
 
@@ -247,9 +331,10 @@ def reap_process_tree(pid: int, timeout: float = 5.0) -> None:
             continue  # Process might have exited already
 
     # Wait for the processes to terminate gracefully
-    gone, alive = psutil.wait_procs(children, timeout=timeout)
+    _, alive = psutil.wait_procs(children, timeout=timeout)
 
-    # For processes still alive after timeout, forcefully kill them
+    # For processes still alive after timeout, forcefully kill them. SIGKILL
+    # cannot be ignored, so a short grace period suffices to reap them.
     if alive:
         log.info(f"Forcefully killing {len(alive)} processes...")
         for p in alive:
@@ -258,14 +343,135 @@ def reap_process_tree(pid: int, timeout: float = 5.0) -> None:
             except psutil.NoSuchProcess:
                 continue
 
-    # Finally, wait for all processes to be reaped
-    gone, alive = psutil.wait_procs(alive, timeout=timeout)
+        _, alive = psutil.wait_procs(alive, timeout=_SIGKILL_GRACE_PERIOD)
+
     if not alive:
         log.info("All processes terminated and reaped.")
     else:
         log.info(f"Some processes could not be terminated: {[p.pid for p in alive]}")
 
 
+def _descendants(pid: int) -> list[int]:
+    """Lists the PIDs of all descendants of ``pid`` by scanning ``/proc`` once for the parent of every process."""
+
+    children = dict()
+
+    with os.scandir("/proc") as entries:
+
+        for entry in entries:
+
+            if not entry.name.isdigit():
+                continue
+
+            try:
+                with open(f"{entry.path}/stat") as src:
+                    stat = src.read()
+            except (FileNotFoundError, ProcessLookupError):  # Exited meanwhile
+                continue
+
+            # The command name is enclosed in parentheses and may contain
+            # spaces. The parent PID is the second field right after it.
+            ppid = int(stat.rpartition(')')[2].split()[1])
+            children.setdefault(ppid, []).append(int(entry.name))
+
+    descendants = list()
+    stack = [pid]
+    while stack:
+        offspring = children.get(stack.pop(), [])
+        descendants += offspring
+        stack += offspring
+
+    return descendants
+
+
+def _wait_pidfds(pidfds: dict[int, int], timeout: float) -> dict[int, int]:
+    """
+    Waits up to ``timeout`` seconds for the processes behind ``pidfds`` to exit. A pidfd becomes readable once its
+    process terminates. Exited direct children of ours are reaped on the way.
+
+    Args:
+        pidfds (dict[int, int]): A pidfd to PID mapping.
+        timeout (float): Time in seconds to wait.
+
+    Returns:
+        dict[int, int]: The pidfd to PID mapping of the processes that are still alive.
+    """
+
+    alive = dict(pidfds)
+    poller = select.poll()
+    for pidfd in alive:
+        poller.register(pidfd, select.POLLIN)
+
+    deadline = time.monotonic() + timeout
+    while alive:
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        for pidfd, _ in poller.poll(remaining * 1_000):
+
+            try:
+                os.waitid(os.P_PIDFD, pidfd, os.WEXITED | os.WNOHANG)
+            except ChildProcessError:  # Not a direct child of ours
+                pass
+
+            poller.unregister(pidfd)
+            del alive[pidfd]
+
+    return alive
+
+
+def _reap_with_pidfds(pid: int, timeout: float) -> None:
+    """
+    Linux implementation of ``reap_process_tree``. Signals are delivered through pidfds, so a PID that is recycled
+    while waiting can never be hit by mistake.
+
+    Raises:
+        NotImplementedError: If the kernel does not support ``pidfd_open``.
+    """
+
+    pidfds = dict()
+    for child in _descendants(pid):
+        try:
+            pidfds[os.pidfd_open(child)] = child
+        except ProcessLookupError:  # Exited meanwhile
+            continue
+        except OSError as e:
+            for pidfd in pidfds:
+                os.close(pidfd)
+            raise NotImplementedError("pidfd_open is not supported") from e
+
+    try:
+        log.info(f"Terminating process tree for PID {pid}...")
+        for pidfd in pidfds:
+            try:
+                signal.pidfd_send_signal(pidfd, signal.SIGTERM)
+            except ProcessLookupError:
+                continue
+
+        alive = _wait_pidfds(pidfds, timeout)
+
+        if alive:
+            log.info(f"Forcefully killing {len(alive)} processes...")
+            for pidfd in alive:
+                try:
+                    signal.pidfd_send_signal(pidfd, signal.SIGKILL)
+                except ProcessLookupError:
+                    continue
+
+            alive = _wait_pidfds(alive, _SIGKILL_GRACE_PERIOD)
+
+    finally:
+        for pidfd in pidfds:
+            os.close(pidfd)
+
+    if not alive:
+        log.info("All processes terminated and reaped.")
+    else:
+        log.info(f"Some processes could not be terminated: {list(alive.values())}")
+
+
 # # # # # # # # # # # # # # # # # # #
 #    ___ _                          #
 #   / __\ | __ _ ___ ___  ___  ___  #
@@ -277,24 +483,54 @@ def reap_process_tree(pid: int, timeout: float = 5.0) -> None:
 class Timer():
     """
     Context manager style timer. To be used as: ``with Timer():``
+
+    The ``mode`` selects the clock: ``"wall"`` for elapsed real time (default) or ``"cpu"`` for the process time.
     """
+    __slots__ = ["mode", "_clock", "start", "end", "interval"]
+
+    _clocks = {
+        "wall": time.perf_counter,
+        "cpu": time.process_time
+    }
+
+    def __init__(self, mode: str = "wall") -> "Timer":
+
+        if mode not in self._clocks:
+            raise ValueError(f"Unknown timer mode {mode}. Expected one of {list(self._clocks.keys())}")
+
+        self.mode = mode
+        self._clock = self._clocks[mode]
 
     def __enter__(self):
 
-        self.start = time.perf_counter()
+        self.start = self._clock()
         return self
 
     def __exit__(self, *args):
 
-        self.end = time.perf_counter()
+        self.end = self._clock()
         self.interval = self.end - self.start
         print(f"Execution time: {self.format_time(self.interval)}")
 
-    def format_time(self, seconds):
+    @staticmethod
+    def format_time(seconds):
+
+        # Short intervals are the common case. Only
+        # split the larger units when they are needed
+        if seconds < 60:
+            return f"{seconds:.2f}s"
+
+        minutes, seconds = divmod(seconds, 60)  # 60 seconds in a minute
+
+        if minutes < 60:
+            return f"{int(minutes)}m {seconds:.2f}s"
+
+        hours, minutes = divmod(minutes, 60)  # 60 minutes in an hour
+
+        if hours < 24:
+            return f"{int(hours)}h {int(minutes)}m {seconds:.2f}s"
 
-        days, remainder = divmod(seconds, 86_400)  # 86400 seconds in a day
-        hours, remainder = divmod(remainder, 3_600)  # 3600 seconds in an hour
-        minutes, seconds = divmod(remainder, 60)  # 60 seconds in a minute
+        days, hours = divmod(hours, 24)  # 24 hours in a day
         return f"{int(days)}d {int(hours)}h {int(minutes)}m {seconds:.2f}s"
 
 
@@ -1,16 +1,63 @@
 #!/usr/bin/python3
 # SPDX-License-Identifier: MIT
 
+import ast
 import subprocess
 import re
 import enum
+import logging
 import pathlib
-
-from testcrush.utils import get_logger, to_snake_case
-from typing import Any
+import os
+import signal
+import threading
+import lark
+import types
+import collections
+import concurrent.futures
+import selectors
+import time
+import functools
+
+from testcrush.utils import get_logger
+
+try:  # Python >= 3.11
+    from re import _parser as _sre_parser, _constants as _sre_constants
+except ImportError:
+    import sre_parse as _sre_parser
+    import sre_constants as _sre_constants
+from typing import Any, Callable, Iterable, Iterator
 
 log = get_logger()
 
+# Default success and TaT regexp of logic simulation. See logic_simulate()
+_DEFAULT_FINISH_RE = re.compile(r"\$finish[^0-9]+([0-9]+)[munp]s", re.DOTALL)
+
+# Status (group) identifiers of a coverage formula and the syntax allowed in it. See _compile_formula()
+_COVERAGE_ID_RE = re.compile(r"[A-Z]{2}")
+_FORMULA_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.operator, ast.unaryop, ast.Name, ast.Load, ast.Constant)
+
+# Numbered back-references, which are shifted when patterns are fused. See _fuse_patterns()
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\\g<[0-9]+>")
+
+# Placeholder for the unset attribute slots of a Fault. See Fault.__eq__()
+_UNSET = object()
+
+# Upper bound of the stderr lines retained while streaming
+_STDERR_MAX_LINES = 1_000
+
+# Upper bound of the bytes retained per stream when the capture is bounded. See ZoixInvoker.execute()
+_MAX_CAPTURE_BYTES = 16 * 1024 * 1024
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Time granted to a process group to exit after SIGTERM before it is killed
+_TERMINATION_GRACE_PERIOD = 0.5
+
+# Lines that open (``Name [Name...] {``) or close (``}``) a fault report
+# section. The leading newline lets re skip ahead to line starts quickly.
+_SECTION_BOUNDARY_RE = re.compile(r"\n[ \t]*"
+                                  r"(?:(?P<name>[A-Za-z_]\w*)(?:[ \t]+[A-Za-z_]\w*)*[ \t]*\{|\})"
+                                  r"[ \t]*(?=\n|\Z)")
+
 
 class Compilation(enum.Enum):
     """Statuses for the VCS compilation of HDL sources."""
@@ -51,35 +98,166 @@ class Fault:
 
     When a fault is constructed it corresponds to a prime fault. It is up to the user to resolve any fault equivalence
     by modifying the aforementioned attributes.
+
+    The attributes emitted by the fault report parser are stored in slots. Any other attribute is kept in a dictionary
+    which is only allocated when such an attribute is first set. Both kinds are set (e.g., ``fault.PC = "0x1c"``), read
+    and deleted as regular attributes.
     """
+    __slots__ = ["fault_status", "fault_type", "timing_info", "fault_sites", "fault_attributes",
+                 "equivalent_faults", "equivalent_to", "_extras"]
+
+    # Slots that hold fault attributes, in representation order
+    _fields = ("fault_status", "fault_type", "timing_info", "fault_sites", "fault_attributes")
+    _field_descriptors: tuple[tuple[str, Any], ...]  # The (name, slot descriptor) pairs of _fields. Set below.
+    _slot_names = frozenset(__slots__)
 
     def __init__(self, **fault_attributes: dict[str, Any]) -> 'Fault':
 
+        self._extras: dict[str, Any] = None
+
         for attribute, value in fault_attributes.items():
-            setattr(self, attribute.replace(" ", "_"), value)
+            self.set(attribute.replace(" ", "_"), value)
 
         self.equivalent_faults: int = 1
         self.equivalent_to: Fault = None
 
+    @classmethod
+    def from_fields(cls, fields: Iterable[tuple[str, Any]]) -> 'Fault':
+        """
+        Constructs a prime fault from ``(name, value)`` pairs of fault attributes, bypassing the keyword arguments and
+        the normalization of the attribute names of ``__init__``. Meant for the fault report parser, which constructs a
+        fault for each line of the fault list.
+
+        Args:
+            fields (Iterable[tuple[str, Any]]): The fault attributes. Each name must be one of ``Fault._fields``.
+
+        Returns:
+            Fault: The new fault.
+        """
+        fault = cls.__new__(cls)
+
+        # Only slots are set, hence the routing of __setattr__() is skipped
+        setslot = object.__setattr__
+        setslot(fault, "_extras", None)
+
+        for field, value in fields:
+            setslot(fault, field, value)
+
+        setslot(fault, "equivalent_faults", 1)
+        setslot(fault, "equivalent_to", None)
+
+        return fault
+
+    def __getattr__(self, attribute: str) -> Any:
+        # Invoked only when the regular lookup fails i.e., for unset slots and extra attributes.
+        if attribute != "_extras" and not attribute.startswith("__"):
+
+            extras = self._extras
+
+            if extras and attribute in extras:
+                return extras[attribute]
+
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attribute}'")
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        # The counterpart of __getattr__: attributes other than the slots are kept in _extras.
+        self.set(attribute, value)
+
+    def __delattr__(self, attribute: str) -> None:
+
+        if attribute in self._slot_names:
+            object.__delattr__(self, attribute)
+
+        elif self._extras and attribute in self._extras:
+            del self._extras[attribute]
+
+        else:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attribute}'")
+
+    def _items(self) -> list[tuple[str, Any]]:
+        """Returns the (name, value) pairs of all fault attributes that have been set."""
+
+        items = list()
+
+        # The slot descriptors are read directly, hence unset slots raise
+        # without falling back to __getattr__.
+        for field, descriptor in self._field_descriptors:
+
+            try:
+                items.append((field, descriptor.__get__(self)))
+            except AttributeError:
+                pass
+
+        if self._extras:
+            items.extend(self._extras.items())
+
+        return items
+
     def __repr__(self):
-        attrs = ', '.join(f'{key}={value!r}' for key, value in self.__dict__.items()
-                          if key not in ("equivalent_faults", "equivalent_to"))  # Avoid recursive reprs
+        attrs = ', '.join(f'{key}={value!r}' for key, value in self._items())
         return f'{self.__class__.__name__}({attrs})'
 
     def __str__(self):
-        return ', '.join(f'{key}: {value}' for key, value in self.__dict__.items()
-                         if key not in ("equivalent_faults", "equivalent_to"))  # Avoid recursive reprs
+        return ', '.join(f'{key}: {value}' for key, value in self._items())
+
+    def _key(self) -> tuple[str, str, tuple[str, ...]]:
+        """
+        Returns the identifying attributes of the fault i.e., its status, type and sites, as an immutable tuple. It is
+        a snapshot, hence it does not follow later modifications of the fault.
+        """
+
+        fault_sites = getattr(self, "fault_sites", None)
+
+        return (getattr(self, "fault_status", None), getattr(self, "fault_type", None),
+                tuple(fault_sites) if fault_sites else ())
+
+    def _field_values(self) -> tuple[Any, ...]:
+        """Returns the values of the attribute slots in ``_fields`` order, with ``_UNSET`` for unset slots."""
+
+        values = list()
+
+        for _, descriptor in self._field_descriptors:
+
+            try:
+                values.append(descriptor.__get__(self))
+            except AttributeError:
+                values.append(_UNSET)
+
+        return tuple(values)
 
     def __eq__(self, other):
 
+        if self is other:
+            return True
+
         if isinstance(other, Fault):
-            return self.__dict__ == other.__dict__
+            # The identifying attributes tell most faults apart. Extra
+            # attributes are compared as mappings, hence the order  in
+            # which they were set does not matter.
+            return (self._key() == other._key()
+                    and self._field_values() == other._field_values()
+                    and (self._extras or {}) == (other._extras or {})
+                    and self.equivalent_faults == other.equivalent_faults
+                    and self.equivalent_to == other.equivalent_to)
 
         return False
 
+    # Faults are mutable (see set() and cast_attribute()), hence unhashable.
+    # Use _key() to key faults explicitly, where needed.
+    __hash__ = None
+
     def set(self, attribute: str, value: Any) -> None:
 
-        setattr(self, attribute, value)
+        if attribute in self._slot_names:
+
+            object.__setattr__(self, attribute, value)
+
+        else:
+
+            if self._extras is None:
+                object.__setattr__(self, "_extras", dict())
+
+            self._extras[attribute] = value
 
     def get(self, attribute: str, default: str | None = None) -> str | Any:
         """
@@ -115,7 +293,7 @@ class Fault:
 
         attribute = attribute.replace(" ", "_")
         try:
-            self.__dict__[attribute] = func(getattr(self, attribute))
+            self.set(attribute, func(getattr(self, attribute)))
 
         except KeyError:
             log.error(f"Attribute {attribute} not a member of {self.__class__}")
@@ -134,57 +312,153 @@ class Fault:
         return self.equivalent_to is None
 
 
+Fault._field_descriptors = tuple((field, vars(Fault)[field]) for field in Fault._fields)
+
+
 class TxtFaultReport:
     """
     Manages the VC-Z01X text report.
     """
-    __slots__ = ["fault_report_path", "fault_report", "fault_list", "status_groups", "coverage"]
+    __slots__ = ["fault_report_path", "_fault_report", "_section_index", "_sections"]
 
     def __init__(self, fault_report: pathlib.Path) -> "TxtFaultReport":
         self.fault_report_path = fault_report  # Store the path, but don't read the file yet
         self.fault_report: str = None
-        self.fault_list: list[Fault] = None
-        self.status_groups: dict[str, list[str]] = None
-        self.coverage: dict[str, str] = None
 
     def __str__(self) -> str:
 
         return f"{self.fault_report_path.resolve()}"
 
-    def _load_fault_report(self):
-        """Load the fault report from the file."""
+    @property
+    def fault_report(self) -> str | None:
+        """The raw text of the fault report."""
+        return self._fault_report
+
+    @fault_report.setter
+    def fault_report(self, fault_report: str | None) -> None:
+        self._fault_report = fault_report
+        self._section_index: dict[str, tuple[int, int]] = None  # Rebuilt lazily by extract()
+        self._sections: dict[str, Any] = dict()  # Parsed lazily by _ensure_section()
+
+    @property
+    def fault_list(self) -> list[Fault] | None:
+        """The faults of the ``FaultList {}`` section. Parsed on first access."""
+        return self._ensure_section("FaultList")
+
+    @fault_list.setter
+    def fault_list(self, fault_list: list[Fault] | None) -> None:
+        self._sections["FaultList"] = fault_list
+
+    @property
+    def status_groups(self) -> dict[str, list[str]] | None:
+        """The status groups of the ``StatusGroups {}`` section. Parsed on first access."""
+        return self._ensure_section("StatusGroups")
+
+    @status_groups.setter
+    def status_groups(self, status_groups: dict[str, list[str]] | None) -> None:
+        self._sections["StatusGroups"] = status_groups
+
+    @property
+    def coverage(self) -> dict[str, str] | None:
+        """The coverage formulas of the ``Coverage {}`` section. Parsed on first access."""
+        return self._ensure_section("Coverage")
+
+    @coverage.setter
+    def coverage(self, coverage: dict[str, str] | None) -> None:
+        self._sections["Coverage"] = coverage
+
+    def _load_fault_report(self) -> bool:
+        """
+        Load the fault report from the file.
+
+        If the content of the file has not changed since it was last loaded, the already parsed sections are kept.
+        The content is compared rather than the modification time, which may not change on a same-size rewrite (e.g.,
+        on filesystems with a coarse timestamp resolution). Reading the file is cheap compared to parsing it.
+
+        Returns:
+            bool: ``True`` if the fault report was (re)loaded. ``False`` if it is unchanged.
+        """
         if not self.fault_report_path.exists():
             raise FileNotFoundError(f"Fault report file {self.fault_report_path} not found.")
 
         with open(self.fault_report_path) as src:
-            self.fault_report = src.read()
+            fault_report = src.read()
 
-    def _parse_sections(self):
-        """Parse the required sections from the fault report."""
-        # Ensure the fault report is loaded before parsing
-        if self.fault_report is None:
-            raise ValueError("Fault report is not loaded.")
+        if fault_report == self.fault_report:
+            log.debug(f"Fault report {self.fault_report_path} is unchanged.")
+            return False
+
+        self.fault_report = fault_report
+        return True
 
-        # Lazy import to avoid circular dependencies
-        from testcrush.grammars.transformers import FaultReportTransformerFactory
+    def _ensure_section(self, section: str) -> Any:
+        """
+        Parses a section of the fault report, unless it is already parsed.
 
-        factory = FaultReportTransformerFactory()
-        for section in ["StatusGroups", "Coverage", "FaultList"]:
-            parser = factory(section)
+        Args:
+            section (str): The case-sensitive section name. E.g., ``Coverage``, ``FaultList``
 
-            try:
-                raw_section = self.extract(section)
-            except ValueError:  # section doesn't exist
-                setattr(self, to_snake_case(section), None)
-                continue
+        Returns:
+            Any: The transformed section or ``None`` if the section (or the fault report) does not exist.
+        """
+        if section in self._sections:
+            return self._sections[section]
 
-            log.debug(f"Parsing {section}")
-            setattr(self, to_snake_case(section), parser.parse(raw_section))
+        if self.fault_report is None:
+            return None
+
+        try:
+            raw_section = self.extract(section)
+        except ValueError:  # section doesn't exist
+            self._sections[section] = None
+            return None
+
+        log.debug(f"Parsing {section}")
+        self._sections[section] = parsed = _get_parser(section).parse(raw_section)
+
+        return parsed
 
     def update(self):
-        """Update and parse all sections once the fault report file is available."""
+        """
+        Update the fault report once the file is available. Its sections are parsed lazily when first accessed, hence
+        unchanged files are not reparsed.
+        """
         self._load_fault_report()  # Read the file
-        self._parse_sections()  # Parse all sections
+
+    def _index_sections(self) -> None:
+        """
+        Records the offsets of every section of the fault report in a single pass.
+
+        A section header is a line made of identifiers followed by an opening brace e.g., ``StatusGroups {`` or
+        ``FaultList SAF {``, and the first identifier is the section name. A section is closed by a line holding only a
+        closing brace. Only these two kinds of lines are visited (via ``_SECTION_BOUNDARY_RE``) and they are paired
+        with a stack, hence the section bodies are never iterated in Python. Nested sections (e.g.,
+        ``PromotionTable``) are indexed as well. Each section spans from the beginning of its header line until the end
+        of its closing line. If a section name appears more than once, the first occurrence is kept.
+        """
+        report = self._fault_report
+        index = dict()
+        stack = list()  # (section name, start offset) of the open sections
+
+        # The prepended newline shifts every offset by one. A match starts at
+        # the newline preceding its line, so boundary.start() is the offset of
+        # the line itself within the report.
+        for boundary in _SECTION_BOUNDARY_RE.finditer(f"\n{report}"):
+
+            name = boundary.group("name")
+
+            if name:
+                stack.append((name, boundary.start()))
+
+            elif stack:
+                name, start = stack.pop()
+                index.setdefault(name, (start, boundary.end() - 1))
+
+        # Unterminated sections extend until the end of the report
+        for name, start in stack:
+            index.setdefault(name, (start, len(report)))
+
+        self._section_index = index
 
     def extract(self, section: str) -> str:
         """
@@ -194,48 +468,27 @@ class TxtFaultReport:
             section (str): The case-sensitive section name. E.g., ``Coverage``, ``FaultList``
 
         Returns:
-            str: A newline-joined string of the extracted section (section name included).
+            str: A newline-joined string of the extracted section (section name included). Empty lines are omitted.
 
         Raises:
             ValueError: If ``section`` does not exist in the fault report.
         """
-        extracted_lines = list()
-
-        # Loop control
-        section_found: bool = False
-        brackets_cc: int = 0
-
-        lines = self.fault_report.splitlines()
-
-        for line in lines:
-
-            if not line:
-                continue
+        if self._section_index is None:
+            self._index_sections()
 
-            if section in line and "{" in line:
-                log.debug(f"Found Section {section} - {line=}")
-                section_found = True
-
-            if not section_found:
-                continue
-
-            if section_found:
-
-                if '{' in line:
-                    brackets_cc += 1
-                if '}' in line:
-                    brackets_cc -= 1
+        if section not in self._section_index:
+            log.debug(f"Requested section \"{section}\" not found!")
+            raise ValueError(f"Requested section \"{section}\" not found!")
 
-                extracted_lines.append(fr'{line}')
+        start, end = self._section_index[section]
+        log.debug(f"Found Section {section} at offsets {start}-{end}")
 
-                if brackets_cc == 0:
-                    break
+        extracted = self._fault_report[start:end]
 
-        if not section_found:
-            log.debug(f"Requested section \"{section}\" not found!")
-            raise ValueError(f"Requested section \"{section}\" not found!")
+        if "\n\n" in extracted:  # Drop empty lines
+            extracted = '\n'.join(line for line in extracted.splitlines() if line)
 
-        return '\n'.join(extracted_lines)
+        return extracted
 
     def compute_coverage(self, requested_formula: str = None, precision: int = 4) -> dict[str, float] | float:
         """
@@ -259,50 +512,270 @@ class TxtFaultReport:
 
         retval = list()
 
-        fault_statusses = dict()
-        for fault in self.fault_list:
+        formulas = self.coverage or dict()
 
-            status = fault.fault_status
+        # Only the requested formula is evaluated
+        if requested_formula:
+            formulas = {requested_formula: formulas[requested_formula]}
 
-            if status in fault_statusses:
-                fault_statusses[status] += 1
-            else:
-                fault_statusses[status] = 1
+        compiled = [(formula_name, *_compile_formula(formula)) for formula_name, formula in formulas.items()]
 
+        fault_statusses = dict()
         status_groups = dict()
-        if self.status_groups:
 
-            for group, statuses in self.status_groups.items():
+        # The fault list is parsed only if some
+        # formula refers to a status or  group.
+        if any(non_present for _, _, non_present in compiled):
 
-                status_groups[group] = 0
+            fault_statusses = collections.Counter(fault.fault_status for fault in self.fault_list)
 
-                for status in statuses:
+            if self.status_groups:
 
-                    if status in fault_statusses:
+                for group, statuses in self.status_groups.items():
 
-                        status_groups[group] += fault_statusses[status]
+                    # Missing statuses count as 0
+                    status_groups[group] = sum(fault_statusses[status] for status in statuses)
 
-        # We expect that if a coverage formula is specified
-        # i.e., Coverage{} exists, then there  may  be some
-        # variables there which may not  exist in  statuses
-        # or groups. Hence we must set them to 0.
-        non_present = dict()
-        if self.coverage:
+            # Looked up as a whole, status groups shadow
+            # statuses, like in the fault report. Counter
+            # is copied to a dict since its 0 default for
+            # missing keys would shadow the builtins too.
+            fault_statusses = dict(fault_statusses)
 
-            for formula_name, formula in self.coverage.items():
+        for formula_name, code, non_present in compiled:
 
-                for status_or_group in re.findall(r"[A-Z]{2}", formula):
+            retval.append((formula_name,
+                           round(eval(code, {}, collections.ChainMap(status_groups, fault_statusses, non_present)),
+                                 precision)))
 
-                    if status_or_group not in fault_statusses and status_or_group not in status_groups:
+        # Else: TODO: Implement default coverage computation according to manual
+        return dict(retval)[requested_formula] if requested_formula else dict(retval)
 
-                        non_present[status_or_group] = 0
 
-                retval.append((formula_name,
-                               round(eval(formula, {**fault_statusses, **status_groups, **non_present}),
-                                     precision)))
+@functools.lru_cache(maxsize=None)
+def _get_parser(section: str) -> lark.Lark:
+    """
+    Builds the parser of a fault report section once per process, since building the LALR tables of a grammar is far
+    more expensive than parsing a section with them.
 
-        # Else: TODO: Implement default coverage computation according to manual
-        return dict(retval)[requested_formula] if requested_formula else dict(retval)
+    Args:
+        section (str): The case-sensitive section name. E.g., ``Coverage``, ``FaultList``
+
+    Returns:
+        lark.Lark: The parser (with its transformer) of the section.
+    """
+    # Lazy import to avoid circular dependencies
+    from testcrush.grammars.transformers import FaultReportTransformerFactory
+
+    return FaultReportTransformerFactory()(section)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_formula(formula: str) -> tuple[types.CodeType, dict[str, int]]:
+    """
+    Compiles a coverage formula of the ``Coverage {}`` section of a fault report.
+
+    We expect that the formula may contain some variables which do not exist in the statuses or the status groups of
+    the fault report. Hence, they must default to 0.
+
+    Args:
+        formula (str): The right hand side of a coverage formula e.g., ``"DD/(NA + DA + DN + DD)"``.
+
+    Returns:
+        tuple[types.CodeType, dict[str, int]]: The compiled formula and the default (0) values of its variables.
+
+    Raises:
+        ValueError: If the formula is not an arithmetic expression of variables and numbers.
+    """
+    expression = ast.parse(formula, mode="eval")
+
+    # The formula is read from a file. Hence, reject anything (calls,
+    # attributes, subscripts etc.) that is not plain arithmetic.
+    for node in ast.walk(expression):
+
+        if not isinstance(node, _FORMULA_NODES) or (isinstance(node, ast.Constant)
+                                                    and not isinstance(node.value, (int, float))):
+            raise ValueError(f"Unsupported {node.__class__.__name__} in coverage formula \"{formula}\"")
+
+    return compile(expression, "<coverage>", "eval"), dict.fromkeys(_COVERAGE_ID_RE.findall(formula), 0)
+
+
+def _signal_process_group(pgid: int, sig: signal.Signals) -> None:
+    """Sends ``sig`` to a process group, ignoring groups that have already exited."""
+    try:
+        os.killpg(pgid, sig)
+    except ProcessLookupError:
+        pass
+
+
+@functools.lru_cache(maxsize=16)
+def _required_literal(regexp: re.Pattern) -> str | None:
+    """
+    Finds the longest literal substring that every match of a regexp contains e.g., ``$finish`` for the default regexp
+    of logic simulation. Since a substring search is far cheaper than a regexp search, it serves as a prefilter.
+
+    Only the literals of the top-level sequence (and of the groups in it) are considered, which are required by
+    construction. Case-insensitive regexps have no required literal.
+
+    Args:
+        regexp (re.Pattern): A compiled regexp.
+
+    Returns:
+        str | None: The longest required literal or ``None`` if there is none.
+    """
+    if not isinstance(regexp.pattern, str) or regexp.flags & re.IGNORECASE:
+        return None
+
+    try:
+        sequence = _sre_parser.parse(regexp.pattern, regexp.flags)
+    except Exception:  # Private API, be defensive
+        return None
+
+    literals = list()
+    stack = [sequence]
+
+    while stack:
+
+        literal = list()
+
+        for opcode, argument in stack.pop():
+
+            if opcode is _sre_constants.LITERAL:
+                literal.append(chr(argument))
+                continue
+
+            # Groups (without scoped flags) are required too
+            if opcode is _sre_constants.SUBPATTERN and not argument[1]:
+                stack.append(argument[-1])
+
+            literals.append(''.join(literal))
+            literal = list()
+
+        literals.append(''.join(literal))
+
+    return max(literals, key=len) or None
+
+
+@functools.lru_cache(maxsize=16)
+def _fuse_patterns(*regexps: re.Pattern) -> re.Pattern | None:
+    """
+    Fuses a series of regexps into a single alternation.
+
+    A string matches the fused pattern if and only if it matches at least one of the regexps. The groups of the match
+    however are not meaningful, hence the fused pattern is meant to be used as a filter. Patterns that cannot be safely
+    combined (different flags, numbered back-references, conflicting group names) are not fused.
+
+    Args:
+        regexps (re.Pattern): A variadic number of compiled regexps.
+
+    Returns:
+        re.Pattern | None: The fused pattern or ``None`` if the regexps cannot be combined.
+    """
+    flags = regexps[0].flags
+
+    if any(regexp.flags != flags or _BACKREFERENCE_RE.search(regexp.pattern) for regexp in regexps):
+        return None
+
+    try:
+        return re.compile('|'.join(f"(?:{regexp.pattern})" for regexp in regexps), flags)
+    except (re.error, TypeError):
+        return None
+
+
+def _stop_process_group(process: subprocess.Popen) -> None:
+    """Terminates the process group of ``process`` and kills it if it does not exit within the grace period."""
+    _signal_process_group(process.pid, signal.SIGTERM)
+
+    try:
+        process.wait(timeout=_TERMINATION_GRACE_PERIOD)
+    except subprocess.TimeoutExpired:
+        _signal_process_group(process.pid, signal.SIGKILL)
+
+
+class _BoundedBuffer:
+    """
+    Byte buffer which retains at most ``limit`` bytes of what is written to it, i.e., the first ``limit // 2`` bytes
+    and the last ones. The dropped middle part is replaced by a marker.
+    """
+    __slots__ = ["limit", "head", "tail", "dropped"]
+
+    def __init__(self, limit: int) -> "_BoundedBuffer":
+        self.limit = limit
+        self.head = bytearray()
+        self.tail = bytearray()
+        self.dropped = 0
+
+    def write(self, data: bytes) -> None:
+
+        head_room = self.limit // 2 - len(self.head)
+
+        if head_room > 0:
+            self.head += data[:head_room]
+            data = data[head_room:]
+
+        self.tail += data
+
+        # Trimmed lazily to amortize the cost of the deletion
+        if len(self.tail) > self.limit:
+            excess = len(self.tail) - self.limit // 2
+            del self.tail[:excess]
+            self.dropped += excess
+
+    def getvalue(self) -> str:
+
+        # The tail may exceed its share of the limit until the next trim
+        excess = max(0, len(self.head) + len(self.tail) - self.limit)
+        tail = self.tail[excess:]
+        dropped = self.dropped + excess
+
+        marker = f"\n... [{dropped} bytes truncated] ...\n".encode() if dropped else b""
+        text = (self.head + marker + tail).decode(errors="replace")
+
+        # Universal newlines, as in text mode
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _communicate_bounded(process: subprocess.Popen, timeout: float | None,
+                         max_capture_bytes: int) -> tuple[str, str] | None:
+    """
+    Reads the ``stdout`` and ``stderr`` of a (binary mode) process until it exits, retaining at most
+    ``max_capture_bytes`` of each stream.
+
+    Returns:
+        tuple[str, str] | None: The stdout and stderr as strings or ``None`` if the timeout expired.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    buffers = {process.stdout: _BoundedBuffer(max_capture_bytes), process.stderr: _BoundedBuffer(max_capture_bytes)}
+
+    process.stdin.close()
+
+    with selectors.DefaultSelector() as selector:
+
+        for stream in buffers:
+            selector.register(stream, selectors.EVENT_READ)
+
+        while selector.get_map():
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+
+            if remaining is not None and remaining <= 0:
+                return None
+
+            for key, _ in selector.select(remaining):
+
+                data = os.read(key.fd, _READ_CHUNK_SIZE)
+
+                if data:
+                    buffers[key.fileobj].write(data)
+                else:  # EOF
+                    selector.unregister(key.fileobj)
+
+    try:
+        process.wait(timeout=None if deadline is None else max(deadline - time.monotonic(), 0))
+    except subprocess.TimeoutExpired:
+        return None
+
+    return buffers[process.stdout].getvalue(), buffers[process.stderr].getvalue()
 
 
 class ZoixInvoker:
@@ -311,12 +784,19 @@ class ZoixInvoker:
         ...
 
     @staticmethod
-    def execute(instruction: str, timeout: float = None) -> tuple[str, str]:
+    def execute(instruction: str, timeout: float = None, max_capture_bytes: int = None,
+                processes: set[subprocess.Popen] = None) -> tuple[str, str]:
         """
         Executes a **bash** instruction and returns the ``stdout`` and ``stderr`` responses as a tuple.
 
         Args:
             instruction (str): The bash instruction to be executed.
+            timeout (float, optional): A timeout in seconds after which the instruction is stopped. Defaults to None.
+            max_capture_bytes (int, optional): If specified, at most this many bytes of each stream are retained,
+                                               i.e., its beginning and its end. Defaults to None (unbounded).
+            processes (set[subprocess.Popen], optional): If specified, the process of the instruction is registered
+                                                         in it while running, so that it can be stopped by another
+                                                         thread. Defaults to None.
 
         Returns:
             tuple(str, str): The stdout (index 0) and the stderr (index 1)
@@ -325,27 +805,186 @@ class ZoixInvoker:
 
         log.debug(f"Executing {instruction}...")
 
+        # Each instruction runs in its own session so that on a timeout the
+        # whole process group (bash and any simulator it forked) is stopped.
         with subprocess.Popen(["/bin/bash", "-c", instruction],
-                              stdin=subprocess.PIPE, stdout=subprocess.PIPE,
-                              stderr=subprocess.PIPE, text=True) as process:
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              text=max_capture_bytes is None, start_new_session=True) as process:
+
+            if processes is not None:
+                processes.add(process)
 
             try:
 
-                stdout, stderr = process.communicate(timeout=timeout)
-                return stdout, stderr
+                if max_capture_bytes is None:
+                    return process.communicate(timeout=timeout)
+
+                streams = _communicate_bounded(process, timeout, max_capture_bytes)
+
+                if streams is not None:
+                    return streams
 
             except subprocess.TimeoutExpired:
+                pass
 
-                log.debug(f"TIMEOUT during the execution of:\n\t{instruction}")
-                process.kill()
-                return "TimeoutExpired", "TimeoutExpired"
+            except BaseException:
+                # E.g., KeyboardInterrupt. Do not leave the simulator running.
+                _stop_process_group(process)
+                raise
 
-    def compile_sources(self, *instructions: str) -> Compilation:
+            finally:
+                if processes is not None:
+                    processes.discard(process)
+
+            log.debug(f"TIMEOUT during the execution of:\n\t{instruction}")
+            _stop_process_group(process)
+            return "TimeoutExpired", "TimeoutExpired"
+
+    @staticmethod
+    def execute_streaming(instruction: str, line_callback: Callable[[str], bool], timeout: float = None) -> str:
+        """
+        Executes a **bash** instruction and hands every ``stdout`` line to ``line_callback`` as soon as it is produced,
+        without retaining the ``stdout`` stream in memory. If the callback returns True, the instruction (and any
+        process it forked) is terminated early: it is sent SIGTERM and it is killed if it does not exit within
+        ``_TERMINATION_GRACE_PERIOD`` seconds. The callback is not invoked for the remaining lines. The ``stderr``
+        stream is drained concurrently.
+
+        Args:
+            instruction (str): The bash instruction to be executed.
+            line_callback (Callable[[str], bool]): Invoked with each ``stdout`` line (newline included). Returns True
+                                                   to request early termination.
+            timeout (float, optional): A timeout in seconds after which the instruction is killed. Defaults to None.
+
+        Returns:
+            str: The (last ``_STDERR_MAX_LINES`` lines of the) stderr, or ``"TimeoutExpired"`` if the timeout expired.
+        """
+
+        log.debug(f"Executing {instruction}...")
+
+        with subprocess.Popen(["/bin/bash", "-c", instruction],
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE, text=True, bufsize=1, start_new_session=True) as process:
+
+            process.stdin.close()
+
+            # A full stderr pipe would block the child. Hence, keep on
+            # draining it while stdout is being consumed.
+            stderr_lines = collections.deque(maxlen=_STDERR_MAX_LINES)
+            stderr_drain = threading.Thread(target=stderr_lines.extend, args=(process.stderr,), daemon=True)
+            stderr_drain.start()
+
+            timed_out = threading.Event()
+
+            def kill_on_timeout():
+                timed_out.set()
+                _signal_process_group(process.pid, signal.SIGKILL)
+
+            watchdog = threading.Timer(timeout, kill_on_timeout) if timeout is not None else None
+            if watchdog:
+                watchdog.start()
+
+            stopper = None
+
+            try:
+
+                for line in process.stdout:
+
+                    # After a stop request, stdout is still drained so
+                    # that a child which ignores SIGTERM and keeps  on
+                    # writing does not block until it is killed.
+                    if stopper is None and line_callback(line):
+
+                        log.debug(f"Early termination of {instruction} requested.")
+                        stopper = threading.Thread(target=_stop_process_group, args=(process,), daemon=True)
+                        stopper.start()
+
+                process.wait()
+
+                if stopper:
+                    stopper.join()
+
+            except BaseException:
+
+                # Do not leave the instruction running behind e.g., when
+                # the callback raises.
+                _signal_process_group(process.pid, signal.SIGKILL)
+                raise
+
+            finally:
+
+                if watchdog:
+                    watchdog.cancel()
+
+            stderr_drain.join()
+
+        if timed_out.is_set():
+
+            log.debug(f"TIMEOUT during the execution of:\n\t{instruction}")
+            return "TimeoutExpired"
+
+        return ''.join(stderr_lines)
+
+    def _execute_all(self, instructions: tuple[str, ...], parallel: int | None = None,
+                     **kwargs) -> Iterator[tuple[str, str, str]]:
+        """
+        Executes a series of instructions and yields their outcome. Once the generator is closed, i.e., when the caller
+        breaks out of the loop, instructions that have not been executed yet are skipped and running ones are stopped.
+
+        Args:
+            instructions (tuple[str, ...]): The bash instructions to be executed.
+            parallel (int, optional): The maximum number of instructions executed concurrently. If not specified, the
+                                      instructions are executed sequentially in the given order. Otherwise, they
+                                      must be independent of each other and they are yielded in order of completion.
+            kwargs: Keyword arguments forwarded to ``execute()``.
+
+        Yields:
+            tuple[str, str, str]: The instruction along with its stdout and stderr.
+        """
+        if not parallel or parallel < 2 or len(instructions) < 2:
+
+            for cmd in instructions:
+
+                stdout, stderr = self.execute(cmd, **kwargs)
+                yield cmd, stdout, stderr
+
+            return
+
+        # Threads suffice, they are only waiting on the subprocesses
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=parallel)
+        processes = set()
+        futures = dict()
+
+        try:
+
+            futures = {executor.submit(self.execute, cmd, processes=processes, **kwargs): cmd for cmd in instructions}
+
+            for future in concurrent.futures.as_completed(futures):
+
+                stdout, stderr = future.result()
+                yield futures[future], stdout, stderr
+
+        finally:
+
+            executor.shutdown(wait=False, cancel_futures=True)
+
+            # Running instructions cannot be cancelled, their process groups are stopped instead
+            while not all(future.done() for future in futures):
+
+                for process in list(processes):
+                    _stop_process_group(process)
+
+                concurrent.futures.wait(futures, timeout=_TERMINATION_GRACE_PERIOD)
+
+            executor.shutdown(wait=True)
+
+    def compile_sources(self, *instructions: str, parallel: int = None) -> Compilation:
         """
         Performs compilation of HDL files
 
         Args:
             instructions (str): A variadic number of bash shell instructions
+            parallel (int, optional): The maximum number of instructions to be executed concurrently. Only for
+                                      independent instructions. Defaults to None (sequential execution).
 
         Returns:
             Compilation: A status Enum to signify the success or failure of the compilation.
@@ -356,9 +995,7 @@ class ZoixInvoker:
 
         compilation_status = Compilation.SUCCESS
 
-        for cmd in instructions:
-
-            stdout, stderr = self.execute(cmd)
+        for cmd, stdout, stderr in self._execute_all(instructions, parallel, max_capture_bytes=_MAX_CAPTURE_BYTES):
 
             if stderr:
 
@@ -407,10 +1044,14 @@ class ZoixInvoker:
                 - **tat_value** (list): An **empty** list to store the TaT value after being successfully matched with
                   ``success_regexp``. The list is used to mimic a pass-by-reference.
 
+                - **stop_on_success** (bool): If True, an instruction is terminated as soon as both the success and the
+                  TaT regexps have matched, instead of running to completion. Only use it when nothing of value (e.g.,
+                  a VCD dump or a processor trace) is written after these lines. Defaults to False.
+
         Returns:
             LogicSimulation: A status Enum which is:
 
-                - TIMEOUT: if user defined timeout has been triggered.
+                - TIMEOUT: if user defined timeout has been triggered before the success and the TaT regexps matched.
                 - SIM_ERROR: if any text was found in the ``stderr`` stream during the execution of an instruction.
                 - SUCCESS: if the halting regexp matched text from the ``stdout`` stream.
         """
@@ -429,10 +1070,25 @@ class ZoixInvoker:
         # have >=1 $finish call locations e.g.
         # on an out-of-bounds read/write case.
         # Hence, be as accurate as possible!!!
-        default_regexp = re.compile(r"\$finish[^0-9]+([0-9]+)[m|u|n|p]s", re.DOTALL)
-
-        success_regexp: re.Pattern = kwargs.get("simulation_ok_regex", default_regexp)
-        tat_regexp: re.Pattern = kwargs.get("test_application_time_regex", default_regexp)
+        success_regexp: re.Pattern = kwargs.get("simulation_ok_regex", _DEFAULT_FINISH_RE)
+        tat_regexp: re.Pattern = kwargs.get("test_application_time_regex", _DEFAULT_FINISH_RE)
+
+        # When both checks use the same  regexp
+        # one search per line serves  them both
+        same_regexp: bool = (success_regexp is tat_regexp
+                             or (success_regexp.pattern == tat_regexp.pattern
+                                 and success_regexp.flags == tat_regexp.flags))
+
+        # Otherwise, a fused alternation of both
+        # rejects the non-matching  lines, which
+        # are the vast majority, with one search
+        fused_regexp: re.Pattern | None = None if same_regexp else _fuse_patterns(success_regexp, tat_regexp)
+
+        # Even cheaper, a line which contains no
+        # literal required by the regexps cannot
+        # match. Only usable if both  have  one.
+        required_literals = {_required_literal(success_regexp), _required_literal(tat_regexp)}
+        literals: tuple[str, ...] | None = None if None in required_literals else tuple(required_literals)
 
         # By default, a single capturing  group
         # is expected in the regexp, which maps
@@ -449,44 +1105,74 @@ class ZoixInvoker:
         # the function's return value.
         tat_value: list = kwargs.get("tat_value", [])
 
+        # By default each instruction runs  to
+        # completion, since the simulator  may
+        # still be writing e.g., its dumps  or
+        # the processor trace after the  lines
+        # that mark the success  and  the  TaT
+        stop_on_success: bool = kwargs.get("stop_on_success", False)
+
         simulation_status = None
 
         # Loop control flags
         exit_success = False
         tat_success = False
 
+        # Hoisted out of the per-line scan below.
+        # Lines are only formatted when logged.
+        debug = log.debug if log.isEnabledFor(logging.DEBUG) else None
+
         for cmd in instructions:
 
-            stdout, stderr = self.execute(cmd, timeout=timeout)
+            # Once both  flags are set, the  rest
+            # of the instructions run to completion
+            # without scanning  their  stdout lines
+            already_succeeded = tat_success and exit_success
 
-            if stderr and stderr != "TimeoutExpired":
+            # Set once the instruction is asked  to
+            # stop. Whatever it writes  to  stderr
+            # while being stopped is not an error
+            stop_requested = False
 
-                log.debug(f"Error during execution of {cmd}\n\
-                ------[STDERR STREAM]------\n\
-                {'-'.join(stderr.splitlines(keepends=True))}\n\
-                ---------------------------\n")
+            def scan(line: str) -> bool:
+                """
+                Matches a single stdout line. Returns True to stop the instruction, i.e., only if ``stop_on_success``
+                is set and the simulation is known to be successful.
+                """
 
-                simulation_status = LogicSimulation.SIM_ERROR
-                break
+                nonlocal exit_success, tat_success, stop_requested
 
-            elif stderr == stdout == "TimeoutExpired":
+                if already_succeeded:
+                    return False
 
-                simulation_status = LogicSimulation.TIMEOUT
-                break
+                if debug:
+                    debug("%s: %s", cmd, line.rstrip())
 
-            for line in stdout.splitlines():
+                # The rest of the lines are  only
+                # drained until the instruction ends
+                if tat_success and exit_success:
+                    return False
 
-                log.debug(f"{cmd}: {line.rstrip()}")
+                if literals is not None:
+
+                    for literal in literals:
+                        if literal in line:
+                            break
+                    else:
+                        return False
+
+                if fused_regexp is not None and not fused_regexp.search(line):
+                    return False
 
                 # Exit success
-                success_match: re.Match = re.search(success_regexp, line)
+                success_match: re.Match = success_regexp.search(line)
 
                 if success_match:
                     log.debug(f"Exit Success: {success_match.groups()}")
                     exit_success = True
 
                 # TaT matching
-                tat_match: re.Match = re.search(tat_regexp, line)
+                tat_match: re.Match = success_match if same_regexp else tat_regexp.search(line)
 
                 if tat_match:
 
@@ -501,17 +1187,50 @@ expression '{tat_regexp}' ?")
 
                     log.debug(f"TaT Captured: {tat_match.groups()}")
 
+                stop_requested = stop_on_success and tat_success and exit_success
+                return stop_requested
+
+            stderr = self.execute_streaming(cmd, scan, timeout=timeout)
+
+            if stop_requested:
+
+                log.debug(f"Stopped {cmd} after a successful simulation, ignoring its stderr.")
+                continue
+
+            if stderr == "TimeoutExpired":
+
+                # The instruction hung after the  lines
+                # that mark the success and the TaT had
+                # been matched. Hence, it is  non-fatal
                 if tat_success and exit_success:
-                    break
 
-        if tat_success and exit_success:
+                    log.debug(f"TIMEOUT after a successful simulation during the execution of {cmd}.")
+                    continue
+
+                simulation_status = LogicSimulation.TIMEOUT
+                break
+
+            elif stderr:
 
-            log.debug(f"Simulation Success! {exit_success=} and {tat_success=}.")
-            simulation_status = LogicSimulation.SUCCESS
+                log.debug(f"Error during execution of {cmd}\n\
+                ------[STDERR STREAM]------\n\
+                {'-'.join(stderr.splitlines(keepends=True))}\n\
+                ---------------------------\n")
+
+                simulation_status = LogicSimulation.SIM_ERROR
+                break
+
+        if simulation_status is None:
+
+            if tat_success and exit_success:
 
-        elif not (tat_success and exit_success) and simulation_status != LogicSimulation.TIMEOUT:
-            log.debug(f"Simulation Failed! {exit_success=} and {tat_success=}.")
-            simulation_status = LogicSimulation.SIM_ERROR
+                log.debug(f"Simulation Success! {exit_success=} and {tat_success=}.")
+                simulation_status = LogicSimulation.SUCCESS
+
+            else:
+
+                log.debug(f"Simulation Failed! {exit_success=} and {tat_success=}.")
+                simulation_status = LogicSimulation.SIM_ERROR
 
         return simulation_status
 
@@ -526,9 +1245,12 @@ expression '{tat_regexp}' ?")
 
                 - timeout (float): A timeout in **seconds** for each fsim
                   instruction.
-                - allow_regexs (list[re.Pattern]): Series of regexps to look for in
+                - allow_regexs (list[re.Pattern | str]): Series of regexps to look for in
                   ``stderr`` and allow continuation without raising any error
-                  messages.
+                  messages. Patterns given as strings are compiled once per call.
+                - parallel (int): The maximum number of instructions to be
+                  executed concurrently. Only for independent instructions.
+                  Sequential execution if not specified.
 
         Returns:
             FaultSimulation: A status Enum which is:
@@ -543,28 +1265,25 @@ expression '{tat_regexp}' ?")
         fault_simulation_status = FaultSimulation.SUCCESS
 
         timeout: float = kwargs.get("timeout", None)
-        allow: list[re.Pattern] = kwargs.get("allow_regexs", None)
+        allow: list[re.Pattern] = [re.compile(regexp) for regexp in kwargs.get("allow_regexs", None) or ()]
+        allow_fused: re.Pattern | None = _fuse_patterns(*allow) if allow else None
 
-        for cmd in instructions:
+        parallel: int = kwargs.get("parallel", None)
 
-            stdout, stderr = self.execute(cmd, timeout=timeout)
+        for cmd, stdout, stderr in self._execute_all(instructions, parallel, timeout=timeout,
+                                                     max_capture_bytes=_MAX_CAPTURE_BYTES):
 
             if stderr and stderr != "TimeoutExpired":
 
                 if allow:
 
-                    continue_execution = False
-
-                    for regexp in allow:
-
-                        if regexp.search(stderr):
-
-                            log.debug(f"Allowing message {regexp.search(stderr)}")
-                            continue_execution = True
-                            break
+                    # A single scan of stderr for all allowed messages, if they can be fused
+                    allowed_match = (allow_fused.search(stderr) if allow_fused is not None
+                                     else next(filter(None, (regexp.search(stderr) for regexp in allow)), None))
 
-                    if continue_execution:
+                    if allowed_match:
 
+                        log.debug(f"Allowing message {allowed_match}")
                         continue
 
                 log.debug(f"Error during execution of {cmd}\n\
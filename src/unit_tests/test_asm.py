@@ -14,13 +14,20 @@ except ModuleNotFoundError:
 import unittest
 import unittest.mock as mock
 
+import functools
+import tempfile
+
 import pathlib
 import os
-import copy
-import shutil
 import random
 import sys
 
+# Seeded so that failures are reproducible. Line numbers never come
+# close to sys.maxsize, so a smaller bound keeps the ints machine-sized.
+_RNG = random.Random(0)
+_MAX_LINENO = 10**9
+
+
 class CodelineTest(unittest.TestCase):
 
     @staticmethod
@@ -29,13 +36,21 @@ class CodelineTest(unittest.TestCase):
 
     def test_repr(self):
 
-        random_int = random.randint(0, sys.maxsize)
+        random_int = _RNG.randint(0, _MAX_LINENO)
         test_obj = self.gen_codeline_obj(random_int)
         self.assertEqual(repr(test_obj), f"Codeline({random_int}, \"Dummy Text\", valid_insn = True)")
 
+    def test_slots(self):
+
+        test_obj = self.gen_codeline_obj(0)
+        self.assertFalse(hasattr(test_obj, "__dict__"))
+
+        with self.assertRaises(AttributeError):
+            test_obj.comment = "not a field"
+
     def test_str(self):
 
-        random_int = random.randint(0, sys.maxsize)
+        random_int = _RNG.randint(0, _MAX_LINENO)
         test_obj = self.gen_codeline_obj(random_int)
         self.assertEqual(str(test_obj), f"[#{random_int}]: Dummy Text")
 
@@ -53,27 +68,27 @@ class CodelineTest(unittest.TestCase):
         """
         The Codeline's lineno attribute shall be reduced by 1.
         """
-        random_non_zero_int = random.randint(1, sys.maxsize)
+        random_non_zero_int = _RNG.randint(1, _MAX_LINENO)
         test_obj = self.gen_codeline_obj(random_non_zero_int)
         test_obj -= 1
         self.assertEqual(test_obj.lineno, random_non_zero_int - 1)
 
     def test_isub_with_random_sequence(self):
 
-        random_100_non_zero_int = [random.randint(1, sys.maxsize) for _ in range(100)]
+        random_100_non_zero_int = [_RNG.randint(1, _MAX_LINENO) for _ in range(100)]
 
         # Test similar to struct appearing in the asm.py code for modifying codelines in candidates
         test_objs = [[self.gen_codeline_obj(random_100_non_zero_int[i]),
                       self.gen_codeline_obj(random_100_non_zero_int[i+1])]
                      for i in range(0, len(random_100_non_zero_int), 2)]
 
-        line_numbers = [[x.lineno, y.lineno] for chunk_codeline in test_objs for x, y in [chunk_codeline]]
+        line_numbers = [[x.lineno, y.lineno] for x, y in test_objs]
 
         for chunk in test_objs:
             for chunk_codeline in chunk:
                 chunk_codeline -= 1
 
-        new_line_numbers = [[x.lineno, y.lineno] for chunk_codeline in test_objs for x, y in [chunk_codeline]]
+        new_line_numbers = [[x.lineno, y.lineno] for x, y in test_objs]
         expected_new_line_numbers = [[random_100_non_zero_int[i]-1,
                                       random_100_non_zero_int[i+1]-1]
                                      for i in range(0, len(random_100_non_zero_int), 2)]
@@ -83,7 +98,7 @@ class CodelineTest(unittest.TestCase):
 
     def test_isub_type_error(self):
 
-        random_non_zero_int = random.randint(1, sys.maxsize)
+        random_non_zero_int = _RNG.randint(1, _MAX_LINENO)
         test_obj = self.gen_codeline_obj(random_non_zero_int)
         # Rhs is an unsupported type
         with self.assertRaises(TypeError) as cm:
@@ -94,26 +109,26 @@ class CodelineTest(unittest.TestCase):
 
     def test_iadd_with_random_codeline(self):
 
-        random_int = random.randint(0, sys.maxsize)
+        random_int = _RNG.randint(0, _MAX_LINENO)
         test_obj = self.gen_codeline_obj(random_int)
         test_obj += 1
         self.assertEqual(test_obj.lineno,  random_int+1)
 
-    def test_isub_with_random_sequence(self):
+    def test_iadd_with_random_sequence(self):
 
-        random_100_non_zero_int = [random.randint(0, sys.maxsize) for _ in range(100)]
+        random_100_non_zero_int = [_RNG.randint(0, _MAX_LINENO) for _ in range(100)]
 
         test_objs = [
             [self.gen_codeline_obj(random_100_non_zero_int[i]),
             self.gen_codeline_obj(random_100_non_zero_int[i+1])] for i in range(0,len(random_100_non_zero_int),2)]
 
-        line_numbers = [[x.lineno, y.lineno ] for chunk_codeline in test_objs for x, y in [chunk_codeline]]
+        line_numbers = [[x.lineno, y.lineno] for x, y in test_objs]
 
         for chunk in test_objs:
             for chunk_codeline in chunk:
                 chunk_codeline += 1
 
-        new_line_numbers = [[x.lineno, y.lineno ] for chunk_codeline in test_objs for x, y in [chunk_codeline]]
+        new_line_numbers = [[x.lineno, y.lineno] for x, y in test_objs]
         expected_new_line_numbers = [
             [random_100_non_zero_int[i]+1,
             random_100_non_zero_int[i+1]+1] for i in range(0,len(random_100_non_zero_int),2)]
@@ -123,7 +138,7 @@ class CodelineTest(unittest.TestCase):
 
     def test_iadd_type_error(self):
 
-        random_int = random.randint(0, sys.maxsize)
+        random_int = _RNG.randint(0, _MAX_LINENO)
         test_obj = self.gen_codeline_obj(random_int)
 
         with self.assertRaises(TypeError) as cm:
@@ -133,8 +148,8 @@ class CodelineTest(unittest.TestCase):
 
     def test_gt_with_codeline(self):
 
-        random_int = random.randint(0, sys.maxsize)
-        greater_random_int = random_int + random.randint(1, sys.maxsize - random_int)
+        random_int = _RNG.randint(0, _MAX_LINENO)
+        greater_random_int = random_int + _RNG.randint(1, _MAX_LINENO - random_int)
 
         test_obj_smaller = self.gen_codeline_obj(random_int)
         test_obj_greater = self.gen_codeline_obj(greater_random_int)
@@ -143,8 +158,8 @@ class CodelineTest(unittest.TestCase):
 
     def test_gt_with_int(self):
 
-        random_int = random.randint(1, sys.maxsize)
-        random_smaller_int = random.randint(0, random_int - 1)
+        random_int = _RNG.randint(1, _MAX_LINENO)
+        random_smaller_int = _RNG.randint(0, random_int - 1)
 
         test_obj = self.gen_codeline_obj(random_int)
 
@@ -154,7 +169,7 @@ class CodelineTest(unittest.TestCase):
 
     def test_gt_type_error(self):
 
-        test_obj = self.gen_codeline_obj(random.randint(0, sys.maxsize))
+        test_obj = self.gen_codeline_obj(_RNG.randint(0, _MAX_LINENO))
 
         # Lhs is Codeline but rhs is an unsupported type
         with self.assertRaises(TypeError) as cm:
@@ -164,8 +179,8 @@ class CodelineTest(unittest.TestCase):
 
     def test_lt(self):
 
-        random_int = random.randint(0, sys.maxsize)
-        greater_random_int = random_int + random.randint(1, sys.maxsize - random_int)
+        random_int = _RNG.randint(0, _MAX_LINENO)
+        greater_random_int = random_int + _RNG.randint(1, _MAX_LINENO - random_int)
 
         test_obj_smaller = self.gen_codeline_obj(random_int)
         test_obj_greater = self.gen_codeline_obj(greater_random_int)
@@ -174,8 +189,8 @@ class CodelineTest(unittest.TestCase):
 
     def test_lt_with_int(self):
 
-        random_int = random.randint(0, sys.maxsize)
-        greater_random_int = random_int + random.randint(1, sys.maxsize - random_int)
+        random_int = _RNG.randint(0, _MAX_LINENO)
+        greater_random_int = random_int + _RNG.randint(1, _MAX_LINENO - random_int)
 
         test_obj_smaller = self.gen_codeline_obj(random_int)
 
@@ -183,7 +198,7 @@ class CodelineTest(unittest.TestCase):
 
     def test_lt_type_error(self):
 
-        test_obj = self.gen_codeline_obj(random.randint(0, sys.maxsize))
+        test_obj = self.gen_codeline_obj(_RNG.randint(0, _MAX_LINENO))
         # Lhs is Codeline but rhs is an unsupported type
         with self.assertRaises(TypeError) as cm:
             test_obj < 3.14
@@ -192,8 +207,8 @@ class CodelineTest(unittest.TestCase):
 
     def test_ge_with_codeline(self):
 
-        random_int = random.randint(0, sys.maxsize)
-        greater_random_int = random_int + random.randint(1, sys.maxsize - random_int)
+        random_int = _RNG.randint(0, _MAX_LINENO)
+        greater_random_int = random_int + _RNG.randint(1, _MAX_LINENO - random_int)
 
         test_obj = self.gen_codeline_obj(random_int)
         test_obj_greater = self.gen_codeline_obj(greater_random_int)
@@ -204,8 +219,8 @@ class CodelineTest(unittest.TestCase):
 
     def test_ge_with_int(self):
 
-        random_int = random.randint(0, sys.maxsize)
-        greater_random_int = random_int + random.randint(1, sys.maxsize - random_int)
+        random_int = _RNG.randint(0, _MAX_LINENO)
+        greater_random_int = random_int + _RNG.randint(1, _MAX_LINENO - random_int)
 
         test_obj = self.gen_codeline_obj(greater_random_int)
 
@@ -214,7 +229,7 @@ class CodelineTest(unittest.TestCase):
 
     def test_ge_type_error(self):
 
-        test_obj = self.gen_codeline_obj(random.randint(0, sys.maxsize))
+        test_obj = self.gen_codeline_obj(_RNG.randint(0, _MAX_LINENO))
 
         # Lhs is Codeline but rhs is an unsupported type
         with self.assertRaises(TypeError) as cm:
@@ -224,8 +239,8 @@ class CodelineTest(unittest.TestCase):
 
     def test_le_with_codeline(self):
 
-        random_int = random.randint(0, sys.maxsize)
-        greater_random_int = random_int + random.randint(1, sys.maxsize - random_int)
+        random_int = _RNG.randint(0, _MAX_LINENO)
+        greater_random_int = random_int + _RNG.randint(1, _MAX_LINENO - random_int)
 
         test_obj = self.gen_codeline_obj(random_int)
         test_obj_greater = self.gen_codeline_obj(greater_random_int)
@@ -241,8 +256,8 @@ class CodelineTest(unittest.TestCase):
 
     def test_le_with_int(self):
 
-        random_int = random.randint(0, sys.maxsize)
-        greater_random_int = random_int + random.randint(1, sys.maxsize - random_int)
+        random_int = _RNG.randint(0, _MAX_LINENO)
+        greater_random_int = random_int + _RNG.randint(1, _MAX_LINENO - random_int)
 
         test_obj = self.gen_codeline_obj(random_int)
 
@@ -251,7 +266,7 @@ class CodelineTest(unittest.TestCase):
 
     def test_le_type_error(self):
 
-        test_obj = self.gen_codeline_obj(random.randint(0, sys.maxsize))
+        test_obj = self.gen_codeline_obj(_RNG.randint(0, _MAX_LINENO))
 
         with self.assertRaises(TypeError) as cm:
             test_obj <= []
@@ -260,10 +275,10 @@ class CodelineTest(unittest.TestCase):
 
     def test_ne_with_codeline(self):
 
-        random_int_1 = random.randint(0, sys.maxsize)
-        random_int_2 = random.randint(0, sys.maxsize)
+        random_int_1 = _RNG.randint(0, _MAX_LINENO)
+        random_int_2 = _RNG.randint(0, _MAX_LINENO)
         while random_int_2 == random_int_1:
-            random_int_2 = random.randint(0, sys.maxsize)
+            random_int_2 = _RNG.randint(0, _MAX_LINENO)
 
         # Both lhs and rhs are Codelines
         test_obj_a = self.gen_codeline_obj(random_int_1)
@@ -272,10 +287,10 @@ class CodelineTest(unittest.TestCase):
 
     def test_ne_with_int(self):
 
-        random_int_1 = random.randint(0, sys.maxsize)
-        random_int_2 = random.randint(0, sys.maxsize)
+        random_int_1 = _RNG.randint(0, _MAX_LINENO)
+        random_int_2 = _RNG.randint(0, _MAX_LINENO)
         while random_int_2 == random_int_1:
-            random_int_2 = random.randint(0, sys.maxsize)
+            random_int_2 = _RNG.randint(0, _MAX_LINENO)
 
         test_obj_a = self.gen_codeline_obj(random_int_1)
         test_obj_b = self.gen_codeline_obj(random_int_2)
@@ -285,7 +300,7 @@ class CodelineTest(unittest.TestCase):
 
     def test_ne_type_error(self):
 
-        test_obj = self.gen_codeline_obj(random.randint(0, sys.maxsize))
+        test_obj = self.gen_codeline_obj(_RNG.randint(0, _MAX_LINENO))
 
         with self.assertRaises(TypeError) as cm:
             test_obj != 3.14
@@ -294,15 +309,16 @@ class CodelineTest(unittest.TestCase):
 
     def test_eq_with_codeline(self):
 
-        random_int = random.randint(0, sys.maxsize)
+        random_int = _RNG.randint(0, _MAX_LINENO)
 
         test_obj_a = self.gen_codeline_obj(random_int)
         test_obj_b = self.gen_codeline_obj(random_int)
         self.assertEqual(test_obj_a, test_obj_b)
+        self.assertTrue(test_obj_a == test_obj_a)
 
     def test_eq_with_int(self):
 
-        random_int = random.randint(0, sys.maxsize)
+        random_int = _RNG.randint(0, _MAX_LINENO)
 
         test_obj = self.gen_codeline_obj(random_int)
 
@@ -310,7 +326,7 @@ class CodelineTest(unittest.TestCase):
 
     def test_eq_type_error(self):
 
-        random_int = random.randint(0, sys.maxsize)
+        random_int = _RNG.randint(0, _MAX_LINENO)
 
         test_obj = self.gen_codeline_obj(random_int)
 
@@ -331,15 +347,20 @@ class ISATest(unittest.TestCase):
         return pathlib.Path(filename).resolve()
 
     @staticmethod
-    def reset_isa_singleton(isa : asm.ISA) -> None:
+    def reset_isa_singleton() -> None:
         """
         The isa object is Singleton. To avoid collisions
         with other tests, the Singleton must be destroyed.
         """
-        singleton_metaclass = isa.__class__.__class__
-        isa_class = isa.__class__
+        type(asm.ISA)._instances.pop(asm.ISA, None)
+
+    def setUp(self):
+        # Every test here exercises the constructor itself,
+        # hence it must start without a cached instance.
+        self.reset_isa_singleton()
 
-        del singleton_metaclass._instances[isa_class]
+    def tearDown(self):
+        self.reset_isa_singleton()
 
     def test_singleton(self):
 
@@ -358,8 +379,6 @@ class ISATest(unittest.TestCase):
             self.assertNotEqual(test_obj_b.source, f"{os.getcwd()}/dummy_isalang/invalid_isalang.isa")
             self.assertEqual(test_obj_b.source, test_obj_a.source)
 
-            self.reset_isa_singleton(test_obj_a)
-
     def test_constructor_file_not_found(self):
 
         with mock.patch("builtins.open", mock.mock_open()) as mocked_open:
@@ -406,9 +425,7 @@ class ISATest(unittest.TestCase):
         mock_instructions = "instruction_a\ninstruction_b\ninstruction_c"
         with mock.patch("builtins.open", mock.mock_open(read_data=mock_instructions)) as mocked_open:
             test_obj = self.gen_isa(pathlib.Path("mock_filename"))
-            self.assertCountEqual(test_obj.mnemonics, {"instruction_a", "instruction_b", "instruction_c"})
-
-        self.reset_isa_singleton(test_obj)
+            self.assertEqual(test_obj.mnemonics, {"instruction_a", "instruction_b", "instruction_c"})
 
     def test_repr(self):
 
@@ -416,17 +433,14 @@ class ISATest(unittest.TestCase):
             test_obj = self.gen_isa(pathlib.Path("mock_filename"))
             self.assertEqual(repr(test_obj), f"ISA({self.resolve_fname('mock_filename')})")
 
-        self.reset_isa_singleton(test_obj)
-
     def test_get_mnemonics(self):
         mock_instructions = "instruction_a\ninstruction_b\ninstruction_c"
         with mock.patch("builtins.open", mock.mock_open(read_data = mock_instructions)) as mocked_open:
             test_obj = self.gen_isa()
             mnemonics = test_obj.get_mnemonics()
 
-        self.assertCountEqual(mnemonics, {"instruction_a", "instruction_b", "instruction_c"})
-
-        self.reset_isa_singleton(test_obj)
+        self.assertEqual(mnemonics, {"instruction_a", "instruction_b", "instruction_c"})
+        self.assertIsInstance(mnemonics, frozenset)
 
     def test_is_instruction(self):
         mock_instructions = "instruction_a\ninstruction_b\ninstruction_c"
@@ -436,7 +450,6 @@ class ISATest(unittest.TestCase):
         self.assertFalse(test_obj.is_instruction("definitely_no"))
         self.assertTrue(test_obj.is_instruction("instruction_a"))
 
-        self.reset_isa_singleton(test_obj)
 
 
 class AssemblyHandlerTest(unittest.TestCase):
@@ -650,6 +663,10 @@ test1:
 	addi s0, sp, 112     # set up s0 to point to start of stack frame
 """
 
+    # Built once since mock_open() is costly and resets its
+    # read data on every open() call, so it can be reused.
+    _SNIPPET_OPEN = mock.mock_open(read_data=RISCV_SNIPPET)
+
     EXPECTED_CANDIDATES = [
         [asm.Codeline(8, "addi sp, sp, -112 # allocate 112 bytes on the stack", valid_insn = True)],
         [asm.Codeline(9, "sw ra, 104(sp) # save return address", valid_insn = True)],
@@ -686,33 +703,42 @@ test1:
         asm.Codeline(22, "addi s0, sp, 112 # set up s0 to point to start of stack frame", valid_insn = True)
     ]
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _cached_isa() -> asm.ISA:
+        """
+        Parses the RISCV_ISALANG only once for all tests. The
+        handlers never modify the ISA, so it is safe to share
+        it. Any left-over Singleton is discarded beforehand to
+        guarantee that the cached ISA is the RISC-V one.
+        """
+        type(asm.ISA)._instances.pop(asm.ISA, None)
+
+        with mock.patch("builtins.open", mock.mock_open(read_data=AssemblyHandlerTest.RISCV_ISALANG)):
+            return asm.ISA(pathlib.Path("some_path"))
+
+    def setUp(self):
+
+        # Every test gets its own directory for the assembly
+        # files that it writes, so tests do not share paths.
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = pathlib.Path(tmp_dir.name).resolve()
+
     def gen_rv_handler(self, assembly_source: pathlib.Path = pathlib.Path("mock_riscv_file"), chunksize: int = 1):
 
-        with mock.patch("builtins.open", mock.mock_open(read_data=self.RISCV_ISALANG)) as mocked_open:
-            isa = asm.ISA(pathlib.Path("some_path"))
+        isa = self._cached_isa()
 
         if assembly_source.name == "mock_riscv_file":
-            with mock.patch("builtins.open", mock.mock_open(read_data=self.RISCV_SNIPPET)) as mocked_open:
+            self._SNIPPET_OPEN.reset_mock()
+            with mock.patch("builtins.open", self._SNIPPET_OPEN):
                 return asm.AssemblyHandler(isa, assembly_source, chunksize)
         else:
             return asm.AssemblyHandler(isa, assembly_source, chunksize)
 
-    @staticmethod
-    def reset_isa_singleton(handler : asm.AssemblyHandler) -> None:
-        """
-        The self.isa of the handler object is Singleton.
-        To avoid collisions with other tests, the Singleton
-        must be destroyed.
-        """
-        singleton_metaclass = handler.isa.__class__.__class__
-        isa_class = handler.isa.__class__
-
-        del singleton_metaclass._instances[isa_class]
-
     def test_constructor(self):
 
-        with mock.patch("builtins.open", mock.mock_open(read_data=self.RISCV_ISALANG)) as mocked_open:
-            isa = asm.ISA(pathlib.Path("some_path"))
+        isa = self._cached_isa()
 
         # manually generating the handler because ISA also uses  open()
         # and we don't want it to be intercepted as it has been already
@@ -723,7 +749,7 @@ test1:
 
             with self.assertRaises(SystemExit) as cm:
 
-                test_obj = asm.AssemblyHandler(isa = asm.ISA(pathlib.Path("../../langs/riscv.irsa")),
+                test_obj = asm.AssemblyHandler(isa = isa,
                     assembly_source = pathlib.Path("an_invalid/assembly_source_path.S"),
                     chunksize = 1)
 
@@ -734,24 +760,18 @@ test1:
         self.assertEqual(test_obj.candidates, self.EXPECTED_CANDIDATES)
         self.assertEqual(test_obj.get_code(), self.EXPECTED_CODE)
 
-        self.reset_isa_singleton(test_obj)
-
     def test_get_asm_source(self):
 
         test_obj = self.gen_rv_handler()
 
         self.assertEqual(str(test_obj.get_asm_source()), f"{os.getcwd()}/mock_riscv_file")
 
-        self.reset_isa_singleton(test_obj)
-
     def test_get_code(self):
 
         test_obj = self.gen_rv_handler()
 
         self.assertEqual(test_obj.get_code(), self.EXPECTED_CODE)
 
-        self.reset_isa_singleton(test_obj)
-
     def test_get_random_candidate(self):
 
         test_obj = self.gen_rv_handler()
@@ -766,16 +786,13 @@ test1:
         new_candidates = [x for sublist in test_obj.candidates for x in sublist]
         self.assertNotIn(random_candidate, new_candidates)
 
-        self.reset_isa_singleton(test_obj)
-
     def test_get_candidate(self):
 
         test_obj = self.gen_rv_handler()
 
         # Everything works as expected. Candidate exists
-        expected_candidate = random.choice(self.EXPECTED_CODE)
+        expected_candidate = _RNG.choice(self.EXPECTED_CODE)
         self.assertEqual(test_obj.get_candidate(expected_candidate.lineno), expected_candidate)
-        self.reset_isa_singleton(test_obj)
 
         # Candidate does not exist
         with self.assertRaises(LookupError) as cm:
@@ -791,15 +808,17 @@ test1:
         lineno attribute by 1 (-=1).
         """
 
-        remove_lineno = random.choice([x.lineno for x in self.EXPECTED_CODE])
-        test_obj = self.gen_rv_handler()
+        remove_lineno = _RNG.choice([x.lineno for x in self.EXPECTED_CODE])
+        test_obj = self.gen_rv_handler(self.tmp_dir / "mock_riscv_file")
         candidate = test_obj.get_candidate(remove_lineno)
 
-        # Deep copy required in order to generate separate
-        # asm.Codeline objects here.
-        candidates_before = [x for chunk in copy.deepcopy(test_obj.candidates) for x in chunk]
+        # Separate asm.Codeline objects are required here
+        # since remove() modifies the candidates in-place.
+        candidates_before = [asm.Codeline(x.lineno, x.data, x.valid_insn)
+                             for chunk in test_obj.candidates for x in chunk]
 
-        with mock.patch("builtins.open", mock.mock_open(read_data=self.RISCV_SNIPPET)):
+        self._SNIPPET_OPEN.reset_mock()
+        with mock.patch("builtins.open", self._SNIPPET_OPEN):
 
             test_obj.remove(candidate)
 
@@ -816,137 +835,101 @@ test1:
         # Also guarantee that the candidate was not popped from the list
         self.assertEqual(removed_candidate_index, candidates_after.index(candidate))
 
-        pathlib.Path("mock_riscv_file").unlink()
-        self.reset_isa_singleton(test_obj)
-
-    def test_remove(self):
-
-        total_lines = len(self.EXPECTED_CODE)
 
-        for lineno in range(total_lines):
+    def write_snippet(self, filename: str = "temp_asm.S") -> pathlib.Path:
 
-            # Generate a temporary .S file
-            with open("temp_asm.S", 'w') as outf:
-                outf.write(self.RISCV_SNIPPET)
+        asm_file = self.tmp_dir / filename
+        asm_file.write_text(self.RISCV_SNIPPET)
 
-            test_obj = self.gen_rv_handler(assembly_source=pathlib.Path("temp_asm.S"))
+        return asm_file
 
-            try:
-                candidate = test_obj.get_candidate(lineno)
-            except LookupError:  # lineno does not correspond to a candidate
-                continue
-
-            # Create a copy to test remove with the replacement of
-            # the original file. Copy it here because the asm_file
-            # attribute will be modified by the first remove  call
-            temp_file = pathlib.Path(f"{test_obj.asm_file}.orig")
-            shutil.copy2(test_obj.asm_file, temp_file)
+    def test_remove(self):
 
-            test_obj.remove(candidate)
+        # Only the candidates can be removed. Every removal
+        # modifies the file, so each one needs a fresh copy.
+        for lineno in [codeline.lineno for codeline in self.EXPECTED_CODE]:
 
-            # Check that the assembly source remains the same.
-            expected_file = pathlib.Path("temp_asm.S")
-            self.assertTrue(expected_file.exists())
-            self.assertEqual(str(test_obj.asm_file), str(expected_file.resolve()))
+            with self.subTest(lineno=lineno):
 
-            new_test_obj = self.gen_rv_handler(expected_file)
-            # Check that new assembly file does not contain the candidate
-            # i.e., diff the two files...
-            self.assertNotIn(str(candidate), [str(x) for x in new_test_obj.get_code()])
+                expected_file = self.write_snippet()
+                test_obj = self.gen_rv_handler(assembly_source=expected_file)
+                candidate = test_obj.get_candidate(lineno)
 
-            # But ensure that the candidate is present in the old one.
-            self.assertIn(str(candidate), [str(x) for x in test_obj.get_code()])
+                test_obj.remove(candidate)
 
-            # Cleanup
-            shutil.copy2(temp_file, expected_file)
-            temp_file.unlink()
+                # Check that the assembly source remains the same.
+                self.assertTrue(expected_file.exists())
+                self.assertEqual(str(test_obj.asm_file), str(expected_file.resolve()))
 
-            self.reset_isa_singleton(test_obj)
+                new_test_obj = self.gen_rv_handler(expected_file)
+                # Check that new assembly file does not contain the candidate
+                # i.e., diff the two files...
+                self.assertNotIn(str(candidate), [str(x) for x in new_test_obj.get_code()])
 
-        pathlib.Path("temp_asm.S").unlink()
+                # But ensure that the candidate is present in the old one.
+                self.assertIn(str(candidate), [str(x) for x in test_obj.get_code()])
 
     def test_restore(self):
 
-        total_lines = self.RISCV_SNIPPET.count('\n')
-
         # Try to restore but nothing should happen
         # as no changes have been performed yet ie
         # changelog is empty!
-        with open("temp_asm.S", 'w') as outf:
-            outf.write(self.RISCV_SNIPPET)
+        asm_file = self.write_snippet()
 
-        test_obj = self.gen_rv_handler(pathlib.Path("temp_asm.S"))
+        test_obj = self.gen_rv_handler(asm_file)
         test_obj.restore()
 
-        for lineno in range(total_lines + 1):
+        self.assertEqual(asm_file.read_text(), self.RISCV_SNIPPET)
 
-           # Generate a temporary .S file
-            with open("temp_asm.S", 'w') as outf:
-                outf.write(self.RISCV_SNIPPET)
+        # A remove followed by a restore leaves the code and the
+        # candidates untouched, so the same handler can be reused.
+        for lineno in [codeline.lineno for codeline in self.EXPECTED_CODE]:
 
-            test_obj = self.gen_rv_handler(pathlib.Path("temp_asm.S"))
+            with self.subTest(lineno=lineno):
 
-            try:
                 candidate = test_obj.get_candidate(lineno)
-            except LookupError:
-                continue
 
-            test_obj.remove(candidate)
+                test_obj.remove(candidate)
 
-            # Check changelog entries
-            self.assertEqual(test_obj.asm_file_changelog, [candidate])
+                # Check changelog entries
+                self.assertEqual(test_obj.asm_file_changelog, [candidate])
 
-            test_obj.restore()
+                test_obj.restore()
 
-            # Check again that changelog is empty now
-            self.assertEqual(test_obj.asm_file_changelog, [])
+                # Check again that changelog is empty now
+                self.assertEqual(test_obj.asm_file_changelog, [])
 
-            # Test the differences of the files
-            test_obj_new = self.gen_rv_handler(test_obj.asm_file)
+                # Test the differences of the files
+                test_obj_new = self.gen_rv_handler(test_obj.asm_file)
 
-            # The code must be the same after restoration
-            self.assertEqual(len(test_obj.get_code()), len(test_obj_new.get_code()))
-            self.assertEqual(test_obj.get_code(), test_obj_new.get_code())
-
-            self.reset_isa_singleton(test_obj)
-
-        pathlib.Path("temp_asm.S").unlink()
+                # The code must be the same after restoration
+                self.assertEqual(len(test_obj.get_code()), len(test_obj_new.get_code()))
+                self.assertEqual(test_obj.get_code(), test_obj_new.get_code())
 
     def test_save(self):
 
-        total_lines = len(self.EXPECTED_CODE)
-
-        for lineno in range(total_lines):
+        for lineno in [codeline.lineno for codeline in self.EXPECTED_CODE]:
 
-           # Generate a temporary .S file
-            with open("temp_asm.S", 'w') as outf:
-                outf.write(self.RISCV_SNIPPET)
+            with self.subTest(lineno=lineno):
 
-            test_obj = self.gen_rv_handler(pathlib.Path("temp_asm.S"))
+                test_obj = self.gen_rv_handler(self.write_snippet())
 
-            retval = test_obj.save()
+                retval = test_obj.save()
 
-            self.assertIsNone(retval)
+                self.assertIsNone(retval)
 
-            try:
                 candidate = test_obj.get_candidate(lineno)
-            except LookupError:
-                continue
-
-            test_obj.remove(candidate)
 
-            # Check changelog entries
-            self.assertEqual(test_obj.asm_file_changelog, [candidate])
+                test_obj.remove(candidate)
 
-            expected_filename = pathlib.Path(f"temp_asm-{candidate.lineno}.S").resolve()
+                # Check changelog entries
+                self.assertEqual(test_obj.asm_file_changelog, [candidate])
 
-            test_obj.save()
+                expected_filename = self.tmp_dir / f"temp_asm-{candidate.lineno}.S"
 
-            # Check that the file has been generated.
-            self.assertTrue(expected_filename.exists())
+                test_obj.save()
 
-            #expected_filename.unlink()
-            self.reset_isa_singleton(test_obj)
-            expected_filename.unlink()
+                # Check that the file has been generated.
+                self.assertTrue(expected_filename.exists())
 
-        pathlib.Path("temp_asm.S").unlink()
+                expected_filename.unlink()
@@ -186,6 +186,9 @@ isa_ = '../../langs/riscv.isa'
 
             isa, asm, settings, preprocessor = config.parse_a0_configuration("some_mocked_file")
 
+        # The configuration is loaded and sanitized in a single pass
+        mocked_open.assert_called_once()
+
         self.assertEqual(isa, "../../langs/riscv.isa")
         self.assertEqual(asm, ['../../cv32e40p/sbst/tests/test1.S'])
         self.maxDiff=None
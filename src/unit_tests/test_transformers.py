@@ -14,13 +14,20 @@ except ModuleNotFoundError:
     from testcrush import zoix
 
 import unittest
+import functools
 import lark
 
 
 class FaultReportFaultListTransformerTest(unittest.TestCase):
 
-    def get_parser(self):
-
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_parser():
+        """
+        The LALR tables are built once for all tests. The transformer
+        resets its state on entry of every parse (see its ``header()``
+        callback), so the parser can be shared even after a failed parse.
+        """
         factory = transformers.FaultReportTransformerFactory()
         return factory("FaultList")
 
@@ -54,6 +61,10 @@ class FaultReportFaultListTransformerTest(unittest.TestCase):
 
         self.assertEqual(fault_list, expected_faults)
 
+        # Statuses and types are interned
+        self.assertIs(fault_list[0].fault_status, fault_list[3].fault_status)
+        self.assertIs(fault_list[1].fault_type, fault_list[2].fault_type)
+
     def test_transition_delay_fault_list(self):
 
         parser = self.get_parser()
@@ -145,6 +156,29 @@ class FaultReportFaultListTransformerTest(unittest.TestCase):
 
         self.assertEqual(fault_list, expected_faults)
 
+    def test_state_reset_after_failed_parse(self):
+
+        parser = self.get_parser()
+        transformer = parser.options.transformer
+
+        # The closing brace is missing
+        with self.assertRaises(lark.exceptions.UnexpectedInput):
+            parser.parse(r"""
+                FaultList SAF {
+                    <  1> ON 0 {PORT "tb.dut.cellA.ZN"}(* "test1"->PC=30551073; *)
+                    <  1> ON 1 {PORT "tb.dut.cellA.ZN"}
+            """)
+
+        self.assertIsNotNone(transformer._prev_prime)
+
+        # The state is reset on entry, before the parse fails on the first fault
+        with self.assertRaises(lark.exceptions.UnexpectedInput):
+            parser.parse(r"""FaultList SAF { -- 0 }""")
+
+        self.assertIsNone(transformer._prev_prime)
+        self.assertEqual(transformer._prev_fstatus, "")
+        self.assertEqual(transformer._strings, {})
+
 
 class FaultReportStatusGroupsTransformerTest(unittest.TestCase):
 
@@ -15,6 +15,7 @@ import unittest
 import unittest.mock as mock
 import pathlib
 import re
+import time
 
 class FaultTest(unittest.TestCase):
 
@@ -25,6 +26,30 @@ class FaultTest(unittest.TestCase):
         self.assertNotEqual(zoix.Fault(arbitrary_attr_b = "sa0"), test_obj)
         self.assertNotEqual(zoix.Fault(arbitrary_attr_a = "sa1"), test_obj)
 
+        # The order in which attributes are set is irrelevant
+        self.assertEqual(zoix.Fault(foo = "1", bar = "2"), zoix.Fault(bar = "2", foo = "1"))
+        self.assertNotEqual(zoix.Fault(foo = "1"), zoix.Fault(foo = "1", bar = "2"))
+        self.assertNotEqual(zoix.Fault(fault_status = "ON"), zoix.Fault(fault_status = "ON", fault_type = None))
+
+    def test_setattr(self):
+
+        # Any attribute can be set, as with a regular object
+        test_obj = zoix.Fault(fault_status = "ON")
+        test_obj.some_new_attr = "x"
+        test_obj.fault_type = "0"
+
+        self.assertEqual(test_obj.some_new_attr, "x")
+        self.assertEqual(test_obj, zoix.Fault(fault_status = "ON", fault_type = "0", some_new_attr = "x"))
+        self.assertEqual(repr(test_obj), "Fault(fault_status='ON', fault_type='0', some_new_attr='x')")
+
+        del test_obj.some_new_attr
+        del test_obj.fault_type
+
+        self.assertEqual(test_obj, zoix.Fault(fault_status = "ON"))
+
+        with self.assertRaises(AttributeError):
+            del test_obj.some_new_attr
+
     def test_repr(self):
 
         test_obj = zoix.Fault(attr_a = "sa0", attr_b = "detected")
@@ -54,6 +79,34 @@ class FaultTest(unittest.TestCase):
             new_test_obj = zoix.Fault(attr_a = "sa1", attr_b = "detected")
             new_test_obj.cast_attribute("attr_a", int)
 
+    def test_slots(self):
+
+        test_obj = zoix.Fault(fault_status = "ON", fault_type = "0", attr_a = "sa0")
+        self.assertFalse(hasattr(test_obj, "__dict__"))
+        self.assertFalse(hasattr(test_obj, "fault_attributes"))
+        self.assertEqual(test_obj.attr_a, "sa0")
+        self.assertEqual(repr(test_obj), "Fault(fault_status='ON', fault_type='0', attr_a='sa0')")
+        self.assertNotEqual(zoix.Fault(fault_status = "ON", fault_type = "0"), test_obj)
+
+    def test_from_fields(self):
+
+        fields = [("fault_status", "ON"), ("fault_type", "0"), ("fault_sites", ["tb.dut.a"])]
+        self.assertEqual(zoix.Fault.from_fields(fields), zoix.Fault(**dict(fields)))
+        self.assertTrue(zoix.Fault.from_fields(fields).is_prime())
+
+    def test_hash(self):
+
+        test_obj = zoix.Fault(fault_status = "ON", fault_type = "0", fault_sites = ["tb.dut.a"])
+        same_obj = zoix.Fault(fault_status = "ON", fault_type = "0", fault_sites = ["tb.dut.a"])
+        other_obj = zoix.Fault(fault_status = "ON", fault_type = "1")
+
+        # Faults are mutable, hence not hashable. Their key is.
+        with self.assertRaises(TypeError):
+            hash(test_obj)
+
+        self.assertEqual(test_obj._key(), same_obj._key())
+        self.assertEqual(len({fault._key(): fault for fault in (test_obj, same_obj, other_obj)}), 2)
+
 class TxtFaultReportTest(unittest.TestCase):
     _fault_report_excerp = r"""
 Date("DDDD TTTTT")
@@ -346,6 +399,82 @@ FaultList {
           -- 0 {PORT "tb_top.wrapper_i.top_i.core_i.ex_stage_i.mult_i.U681.A"}
 }""")
 
+    def test_extract_missing_section(self):
+
+        test_obj = self.create_object()
+
+        with self.assertRaises(ValueError) as cm:
+            test_obj.extract("NonExistentSection")
+
+        self.assertEqual(str(cm.exception), 'Requested section "NonExistentSection" not found!')
+
+        # Named sections are indexed by their leading identifier
+        test_obj.fault_report = "FaultList SAF {\n    <  1> ON 0 {PORT \"tb.dut.a\"}\n}\n"
+        self.assertEqual(test_obj.extract("FaultList"), test_obj.fault_report.rstrip())
+
+    def test_update_unchanged_report(self):
+
+        test_obj = zoix.TxtFaultReport(mock.MagicMock())
+
+        with mock.patch("builtins.open", mock.mock_open(read_data=self._fault_report_excerp)):
+            test_obj.update()
+
+        status_groups = test_obj.status_groups
+
+        with mock.patch("builtins.open", mock.mock_open(read_data=self._fault_report_excerp)):
+            test_obj.update()
+
+        self.assertIs(test_obj.status_groups, status_groups)
+
+        # Same-size rewrite, which the modification time may not reveal
+        rewritten_report = self._fault_report_excerp.replace("NA ", "ND ", 1)
+        self.assertEqual(len(rewritten_report), len(self._fault_report_excerp))
+
+        with mock.patch("builtins.open", mock.mock_open(read_data=rewritten_report)):
+            test_obj.update()
+
+        self.assertEqual(test_obj.fault_report, rewritten_report)
+        self.assertIsNot(test_obj.status_groups, status_groups)
+
+    def test_parser_reuse(self):
+
+        self.assertIs(zoix._get_parser("FaultList"), zoix._get_parser("FaultList"))
+
+        # The cached parser yields the same fault list every time
+        self.assertEqual(self.create_object().fault_list, self.create_object().fault_list)
+
+        # Repeated attribute names and values share a single object
+        fault_list = self.create_object().fault_list
+        self.assertIs(fault_list[0].fault_attributes["INSTR"], fault_list[2].fault_attributes["INSTR"])
+        self.assertIs(*(next(iter(fault.fault_attributes)) for fault in (fault_list[0], fault_list[2])))
+
+    def test_compile_formula(self):
+
+        code, non_present = zoix._compile_formula("DD/(NA + DA + DN + DD) * 100")
+        self.assertEqual(non_present, {"DD": 0, "NA": 0, "DA": 0, "DN": 0})
+        self.assertEqual(eval(code, {}, {"DD": 1, "NA": 1, "DA": 0, "DN": 2}), 25.0)
+
+        for formula in ("__import__('os').getcwd()", "DD.real", "DD[0]", "'DD'", "[DD, NA]"):
+
+            with self.assertRaises(ValueError):
+                zoix._compile_formula(formula)
+
+    def test_lazy_sections(self):
+
+        test_obj = zoix.TxtFaultReport(pathlib.Path("mock_fault_report"))
+        self.assertIsNone(test_obj.fault_list)
+
+        test_obj.fault_report = self._fault_report_excerp
+        test_obj.coverage = {"Constant Coverage": "1/2"}
+
+        with mock.patch("testcrush.zoix.TxtFaultReport._load_fault_report") as mocked_load:
+
+            # No formula variables, hence the fault list is not needed
+            self.assertEqual(test_obj.compute_coverage("Constant Coverage"), 0.5)
+            self.assertNotIn("FaultList", test_obj._sections)
+
+        self.assertEqual(len(test_obj.fault_list), 11)
+
     def test_compute_coverage(self):
 
         test_obj = self.create_object()
@@ -377,6 +506,66 @@ class ZoixInvokerTest(unittest.TestCase):
         stdout, stderr = test_obj.execute("for i in $(seq 100000); do echo $i; done", timeout = 0.1)
         self.assertEqual([stdout, stderr], ["TimeoutExpired", "TimeoutExpired"])
 
+        # Bounded capture retains the beginning and the end of each stream
+        stdout, stderr = test_obj.execute("seq 100000; echo error >&2", max_capture_bytes = 1000)
+        self.assertTrue(stdout.startswith("1\n2\n3\n"))
+        self.assertTrue(stdout.endswith("99999\n100000\n"))
+        self.assertIn("bytes truncated", stdout)
+        marker = re.search(r"\n\.\.\. \[[0-9]+ bytes truncated\] \.\.\.\n", stdout).group()
+        self.assertLessEqual(len(stdout), 1000 + len(marker))
+        self.assertEqual(stderr, "error\n")
+
+        stdout, stderr = test_obj.execute("sleep 5", timeout = 0.1, max_capture_bytes = 1000)
+        self.assertEqual([stdout, stderr], ["TimeoutExpired", "TimeoutExpired"])
+
+        # Interruptions (e.g., Ctrl-C) stop the process group and propagate
+        with mock.patch("subprocess.Popen.communicate", side_effect = KeyboardInterrupt), \
+             mock.patch("testcrush.zoix._stop_process_group", wraps = zoix._stop_process_group) as mock_stop:
+
+            with self.assertRaises(KeyboardInterrupt):
+                test_obj.execute("sleep 10")
+
+            mock_stop.assert_called_once()
+            self.assertIsNotNone(mock_stop.call_args.args[0].returncode)
+
+    def test_execute_streaming(self):
+
+        test_obj = zoix.ZoixInvoker()
+
+        lines = list()
+        stderr = test_obj.execute_streaming("echo line_a; echo line_b; echo error >&2", lambda line: lines.append(line))
+        self.assertEqual(lines, ["line_a\n", "line_b\n"])
+        self.assertEqual(stderr, "error\n")
+
+        # Early termination requested by the callback
+        lines = list()
+        stderr = test_obj.execute_streaming("echo line_a; sleep 10; echo line_b",
+                                            lambda line: lines.append(line) or True, timeout = 5)
+        self.assertEqual(lines, ["line_a\n"])
+        self.assertEqual(stderr, "")
+
+        # Processes ignoring SIGTERM are killed and their remaining stdout is drained
+        stderr = test_obj.execute_streaming("trap '' TERM; echo hi; seq 2000000", lambda line: True, timeout = 30)
+        self.assertEqual(stderr, "")
+
+        stderr = test_obj.execute_streaming("sleep 10", lambda line: False, timeout = 0.1)
+        self.assertEqual(stderr, "TimeoutExpired")
+
+    @staticmethod
+    def mock_execute_streaming(stdout: str, stderr: str):
+        """Feeds ``stdout`` line by line to the callback of ``execute_streaming`` and returns ``stderr``."""
+
+        def execute_streaming(instruction, line_callback, timeout = None):
+
+            if stderr != "TimeoutExpired":
+                for line in stdout.splitlines(keepends = True):
+                    if line_callback(line):
+                        break
+
+            return stderr
+
+        return execute_streaming
+
     def test_compile_sources(self):
 
         test_obj = zoix.ZoixInvoker()
@@ -393,6 +582,19 @@ class ZoixInvokerTest(unittest.TestCase):
 
             self.assertEqual(compilation, zoix.Compilation.ERROR)
 
+        # Independent instructions executed concurrently
+        compilation = test_obj.compile_sources("echo a", "echo b", "echo c", parallel = 2)
+        self.assertEqual(compilation, zoix.Compilation.SUCCESS)
+
+        compilation = test_obj.compile_sources("echo a", "echo b >&2", "echo c", parallel = 2)
+        self.assertEqual(compilation, zoix.Compilation.ERROR)
+
+        # Running instructions are stopped once an error is found
+        start = time.monotonic()
+        compilation = test_obj.compile_sources("echo a >&2", "sleep 30", "sleep 30", parallel = 3)
+        self.assertEqual(compilation, zoix.Compilation.ERROR)
+        self.assertLess(time.monotonic() - start, 10)
+
     def test_logic_simulate(self):
 
         test_obj = zoix.ZoixInvoker()
@@ -466,7 +668,7 @@ Day Month HH:MM:SS YYYY
         }
 
         # Simulation Success
-        with mock.patch("testcrush.zoix.ZoixInvoker.execute", return_value = (logic_sim_snippet, "")) as mocked_execute:
+        with mock.patch("testcrush.zoix.ZoixInvoker.execute_streaming", side_effect = self.mock_execute_streaming(logic_sim_snippet, "")) as mocked_execute:
 
             self.assertEqual(tat_dict["tat_value"], [])
 
@@ -483,24 +685,89 @@ Day Month HH:MM:SS YYYY
             self.assertEqual(logic_simulation, zoix.LogicSimulation.SUCCESS)
             self.assertEqual(tat_dict["tat_value"].pop(), 482140)
 
+        # The simulation runs to completion, unless early termination is requested
+        for stop_on_success, expected_requests in [(False, 0), (True, 1)]:
+
+            requests = list()
+
+            def execute_streaming(instruction, line_callback, timeout = None):
+                requests.extend(line for line in logic_sim_snippet.splitlines(keepends = True) if line_callback(line))
+                return ""
+
+            with mock.patch("testcrush.zoix.ZoixInvoker.execute_streaming", side_effect = execute_streaming):
+
+                logic_simulation = test_obj.logic_simulate("mock_logic_simulation_instruction",
+                                                           stop_on_success = stop_on_success, **tat_dict)
+                self.assertEqual(logic_simulation, zoix.LogicSimulation.SUCCESS)
+                self.assertEqual(tat_dict["tat_value"].pop(), 482140)
+                self.assertEqual(len(requests), expected_requests)
+
         # Simulation Error
-        with mock.patch("testcrush.zoix.ZoixInvoker.execute", return_value = (logic_sim_snippet, "stderr has text!")) as mocked_execute:
+        with mock.patch("testcrush.zoix.ZoixInvoker.execute_streaming", side_effect = self.mock_execute_streaming(logic_sim_snippet, "stderr has text!")) as mocked_execute:
 
             logic_simulation = test_obj.logic_simulate("mock_logic_simulation_instruction")
             self.assertEqual(logic_simulation, zoix.LogicSimulation.SIM_ERROR)
 
         # Stout contains error messages from lsim
-        with mock.patch("testcrush.zoix.ZoixInvoker.execute", return_value = (faulty_lsim_snippet, "")) as mocked_execute:
+        with mock.patch("testcrush.zoix.ZoixInvoker.execute_streaming", side_effect = self.mock_execute_streaming(faulty_lsim_snippet, "")) as mocked_execute:
 
             logic_simulation = test_obj.logic_simulate("mock_logic_simulation_instruction", **tat_dict)
             self.assertEqual(logic_simulation, zoix.LogicSimulation.SIM_ERROR)
 
         # Simulation Timeout
-        with mock.patch("testcrush.zoix.ZoixInvoker.execute", return_value = ("TimeoutExpired", "TimeoutExpired")) as mocked_execute:
+        with mock.patch("testcrush.zoix.ZoixInvoker.execute_streaming", side_effect = self.mock_execute_streaming("", "TimeoutExpired")) as mocked_execute:
 
             logic_simulation = test_obj.logic_simulate("mock_logic_simulation_instruction")
             self.assertEqual(logic_simulation, zoix.LogicSimulation.TIMEOUT)
 
+        # A timeout after the success and the TaT lines is not fatal
+        tat_dict["test_application_time_regex"] = re.compile(r"test application time = ([0-9]+)")
+
+        logic_simulation = test_obj.logic_simulate("echo 'EXIT SUCCESS'; echo 'test application time = 42'; sleep 10",
+                                                   timeout = 0.5, **tat_dict)
+        self.assertEqual(logic_simulation, zoix.LogicSimulation.SUCCESS)
+        self.assertEqual(tat_dict["tat_value"].pop(), 42)
+
+        logic_simulation = test_obj.logic_simulate("echo 'EXIT SUCCESS'; sleep 10", timeout = 0.5, **tat_dict)
+        self.assertEqual(logic_simulation, zoix.LogicSimulation.TIMEOUT)
+
+        # Whatever is written to stderr while being stopped on success is not an error
+        logic_simulation = test_obj.logic_simulate("trap 'echo stopped >&2; exit 1' TERM; echo 'EXIT SUCCESS'; "
+                                                   "echo 'test application time = 7'; sleep 10 & wait",
+                                                   timeout = 5, stop_on_success = True, **tat_dict)
+        self.assertEqual(logic_simulation, zoix.LogicSimulation.SUCCESS)
+        self.assertEqual(tat_dict["tat_value"].pop(), 7)
+
+    def test_fuse_patterns(self):
+
+        fused = zoix._fuse_patterns(re.compile(r"EXIT\sSUCCESS"), re.compile(r"tat = ([0-9]+)"))
+        self.assertTrue(fused.search("EXIT SUCCESS"))
+        self.assertTrue(fused.search("tat = 10"))
+        self.assertIsNone(fused.search("$finish at simulation time  10ns"))
+
+        fused = zoix._fuse_patterns(re.compile(r"Warning"), re.compile(r"Info"), re.compile(r"Note"))
+        self.assertTrue(fused.search("Note: something"))
+        self.assertIsNone(fused.search("Error: something"))
+
+        # Different flags and numbered back-references are not fused
+        self.assertIsNone(zoix._fuse_patterns(re.compile(r"ok", re.I), re.compile(r"tat = ([0-9]+)")))
+        self.assertIsNone(zoix._fuse_patterns(re.compile(r"(o)\1k"), re.compile(r"tat = ([0-9]+)")))
+
+        # Conflicting group names cannot be fused
+        self.assertIsNone(zoix._fuse_patterns(re.compile(r"(?P<x>ok)"), re.compile(r"(?P<x>[0-9]+)")))
+
+    def test_required_literal(self):
+
+        self.assertEqual(zoix._required_literal(zoix._DEFAULT_FINISH_RE), "$finish")
+        self.assertEqual(zoix._required_literal(re.compile(r"test application time = ([0-9]+)")),
+                         "test application time = ")
+        self.assertEqual(zoix._required_literal(re.compile(r"(ab)+cd?")), "c")
+
+        # No literal is required by every match
+        self.assertIsNone(zoix._required_literal(re.compile(r"EXIT|SUCCESS")))
+        self.assertIsNone(zoix._required_literal(re.compile(r"[0-9]+")))
+        self.assertIsNone(zoix._required_literal(re.compile(r"exit success", re.IGNORECASE)))
+
     def test_fault_simulate(self):
 
         test_obj = zoix.ZoixInvoker()
@@ -517,6 +784,11 @@ Day Month HH:MM:SS YYYY
                                                        allow_regexs = [re.compile(r"Stderr text but must be ignored\!")])
             self.assertEqual(fault_simulation, zoix.FaultSimulation.SUCCESS)
 
+            # Patterns may also be given as strings
+            fault_simulation = test_obj.fault_simulate("mock_fsim_instruction1", "mock_fsim_instruction2",
+                                                       allow_regexs = [r"Stderr text but must be ignored\!"])
+            self.assertEqual(fault_simulation, zoix.FaultSimulation.SUCCESS)
+
         # FSIM Error
         with mock.patch("testcrush.zoix.ZoixInvoker.execute", return_value = ("Some fault sim text", "Stderr has text!")) as mocked_execute:
 